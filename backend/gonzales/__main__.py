@@ -1,3 +1,5 @@
+import sys
+
 import uvicorn
 
 from gonzales.config import settings
@@ -22,23 +24,31 @@ GREEN = "\033[1;32m"
 DIM = "\033[2m"
 
 
-def main() -> None:
-    print(f"{CYAN}{BANNER}{RESET}")
+_STARTUP_TEXT = (
+    f"{CYAN}{BANNER}{RESET}\n"
+    f"  {GREEN}Web Interface:{RESET}  {{url}}\n"
+    f"  {DIM}{{hint}}{RESET}\n"
+    "\n"
+)
+_INGRESS_HINT = "Access via Home Assistant sidebar (Ingress)."
+_BROWSER_HINT = "Open this URL in your browser to access the dashboard."
+_NO_API_KEY_WARNING = (
+    f"{YELLOW}WARNING: Binding to {{host}} without an API key.{RESET}\n"
+    f"{YELLOW}Mutating endpoints (trigger, config, delete) are unprotected.{RESET}\n"
+    f"{YELLOW}Set GONZALES_API_KEY to secure your instance.{RESET}\n"
+    "\n"
+)
 
-    url = f"http://{settings.host}:{settings.port}"
-    print(f"  {GREEN}Web Interface:{RESET}  {url}")
-    if settings.ha_addon:
-        print(f"  {DIM}Access via Home Assistant sidebar (Ingress).{RESET}")
-    else:
-        print(f"  {DIM}Open this URL in your browser to access the dashboard.{RESET}")
-    print()
 
+def main() -> None:
+    text = _STARTUP_TEXT.format(
+        url=f"http://{settings.host}:{settings.port}",
+        hint=_INGRESS_HINT if settings.ha_addon else _BROWSER_HINT,
+    )
     if settings.host != "127.0.0.1" and not settings.api_key:
-        print(
-            f"{YELLOW}WARNING: Binding to {settings.host} without an API key.{RESET}\n"
-            f"{YELLOW}Mutating endpoints (trigger, config, delete) are unprotected.{RESET}\n"
-            f"{YELLOW}Set GONZALES_API_KEY to secure your instance.{RESET}\n"
-        )
+        text += _NO_API_KEY_WARNING.format(host=settings.host)
+    sys.stdout.write(text)
+    sys.stdout.flush()
 
     uvicorn.run(
         "gonzales.main:app",
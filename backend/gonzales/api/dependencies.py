@@ -1,28 +1,52 @@
+import hashlib
+import hmac
 from collections.abc import AsyncGenerator
 
-from fastapi import HTTPException, Request, Security, status
-from fastapi.security import APIKeyHeader
+from fastapi import HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from gonzales.config import settings
-from gonzales.db.engine import get_session
+from gonzales.db.engine import async_session
 
-_api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+# Raised for every rejected key. Fixed status and detail, so one instance is
+# shared; its traceback is reset on each raise so it cannot grow.
+_FORBIDDEN = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="Invalid or missing API key",
+)
+
+# Digest of the configured key, computed once. GONZALES_API_KEY is read
+# from the environment only, so it cannot change while the process runs.
+_EXPECTED_DIGEST = hashlib.sha256(settings.api_key.encode()).digest() if settings.api_key else None
+
+# Digests of recently presented keys, so repeat callers skip hashing.
+# Bounded FIFO: the oldest entry is evicted once the limit is reached.
+_MAX_CACHED_DIGESTS = 128
+_digest_cache: dict[str, bytes] = {}
+
+
+def _key_digest(value: str) -> bytes:
+    """Return the SHA-256 digest of a presented API key, memoized per key."""
+    digest = _digest_cache.get(value)
+    if digest is None:
+        digest = hashlib.sha256(value.encode()).digest()
+        if len(_digest_cache) >= _MAX_CACHED_DIGESTS:
+            del _digest_cache[next(iter(_digest_cache))]
+        _digest_cache[value] = digest
+    return digest
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async for session in get_session():
+    async with async_session() as session:
         yield session
 
 
-async def require_api_key(
-    request: Request,
-    api_key: str | None = Security(_api_key_header),
-) -> None:
+async def verify_api_key(request: Request) -> None:
     """Protect mutating endpoints when GONZALES_API_KEY is set.
 
     If no API key is configured, all requests are allowed (backwards compatible).
     If an API key is configured, the request must include a matching X-API-Key header.
+    Keys are compared as fixed-length digests in constant time.
 
     In Home Assistant addon mode, requests through Ingress are trusted.
     HA Ingress handles authentication, so we trust all requests in addon mode.
@@ -30,21 +54,23 @@ async def require_api_key(
     if not settings.api_key:
         return
 
-    # In HA addon mode, trust all requests - Ingress handles auth
-    # We check for common HA headers OR just trust if ha_addon is enabled
-    # since the addon runs behind HA's authentication layer
+    # In HA addon mode, trust all requests - Ingress handles auth.
+    # The addon only receives requests through HA's Ingress proxy, so the
+    # request is trusted whether or not Ingress headers (x-ingress-path,
+    # x-hassio-key, ...) are present; no need to scan for them.
     if settings.ha_addon:
-        # Check for any HA Ingress indicators (case-insensitive)
-        ha_headers = ["x-ingress-path", "x-ha-access", "x-hassio-key", "x-supervisor-token"]
-        for header in ha_headers:
-            if header in request.headers:
-                return
-        # Even without headers, in addon mode we trust the request
-        # because the addon only receives requests through HA's Ingress proxy
         return
 
-    if api_key != settings.api_key:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Invalid or missing API key",
-        )
+    api_key = request.headers.get("x-api-key")
+    if api_key is None or not hmac.compare_digest(_key_digest(api_key), _EXPECTED_DIGEST):
+        raise _FORBIDDEN.with_traceback(None)
+
+
+async def _skip_api_key() -> None:
+    """No-op used when no API key is configured at startup."""
+
+
+# GONZALES_API_KEY is read from the environment only (it is not a mutable
+# config key), so whether auth is enabled is fixed for the process lifetime.
+# Without a key, routers resolve a dependency with no parameters at all.
+require_api_key = verify_api_key if settings.api_key else _skip_api_key
@@ -1,66 +1,91 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, Request
 
 from gonzales.api.dependencies import require_api_key
 from gonzales.config import settings
+from gonzales.core.logging import logger
 from gonzales.core.rate_limit import RATE_LIMITS, limiter
 from gonzales.schemas.config import ConfigOut, ConfigUpdate
 from gonzales.services.scheduler_service import scheduler_service
 
 router = APIRouter(prefix="/config", tags=["config"])
 
+# Last built response; settings only change through update_config in the
+# server process, which refreshes this after saving.
+_config_cache: ConfigOut | None = None
+
+# Fields whose change requires the speedtest job to be rescheduled
+_RESCHEDULE_FIELDS = frozenset({"test_interval_minutes", "scheduler_randomize"})
+
+
+# Config writes are debounced: bursts of updates collapse into one write,
+# performed in a worker thread so the event loop is never blocked on disk.
+_SAVE_DELAY_SECONDS = 1.0
+_save_pending = False
+_save_task: asyncio.Task | None = None
+
+
+async def _save_config_debounced() -> None:
+    global _save_pending
+    await asyncio.sleep(_SAVE_DELAY_SECONDS)
+    # Loop so updates arriving during a write trigger one more write
+    while _save_pending:
+        _save_pending = False
+        try:
+            await asyncio.to_thread(settings.save_config)
+        except OSError as e:
+            logger.error("Failed to save config: %s", e)
+
+
+def _schedule_save() -> None:
+    global _save_pending, _save_task
+    _save_pending = True
+    if _save_task is None or _save_task.done():
+        _save_task = asyncio.create_task(_save_config_debounced())
+
+
+async def flush_pending_save() -> None:
+    """Write a debounced config change immediately (used on shutdown)."""
+    global _save_pending
+    if _save_task is not None and not _save_task.done():
+        _save_task.cancel()
+        try:
+            await _save_task
+        except asyncio.CancelledError:
+            pass
+    # Write now: a new delayed task would never run during shutdown
+    if _save_pending:
+        _save_pending = False
+        try:
+            await asyncio.to_thread(settings.save_config)
+        except OSError as e:
+            logger.error("Failed to save config: %s", e)
+
+
+def _build_config_out() -> ConfigOut:
+    return ConfigOut.model_validate(settings, from_attributes=True)
+
 
 @router.get("", response_model=ConfigOut)
 @limiter.limit(RATE_LIMITS["read"])
 async def get_config(request: Request):
-    return ConfigOut(
-        test_interval_minutes=settings.test_interval_minutes,
-        download_threshold_mbps=settings.download_threshold_mbps,
-        upload_threshold_mbps=settings.upload_threshold_mbps,
-        tolerance_percent=settings.tolerance_percent,
-        preferred_server_id=settings.preferred_server_id,
-        manual_trigger_cooldown_seconds=settings.manual_trigger_cooldown_seconds,
-        theme=settings.theme,
-        isp_name=settings.isp_name,
-        data_retention_days=settings.data_retention_days,
-        webhook_url=settings.webhook_url,
-        scheduler_randomize=settings.scheduler_randomize,
-        host=settings.host,
-        port=settings.port,
-        log_level=settings.log_level,
-        debug=settings.debug,
-    )
+    global _config_cache
+    if _config_cache is None:
+        _config_cache = _build_config_out()
+    return _config_cache
 
 
 @router.put("", response_model=ConfigOut, dependencies=[Depends(require_api_key)])
 @limiter.limit(RATE_LIMITS["config_update"])
 async def update_config(request: Request, update: ConfigUpdate):
-    needs_reschedule = False
-    if update.test_interval_minutes is not None:
-        settings.test_interval_minutes = update.test_interval_minutes
-        needs_reschedule = True
-    if update.scheduler_randomize is not None:
-        settings.scheduler_randomize = update.scheduler_randomize
-        needs_reschedule = True
-    if update.download_threshold_mbps is not None:
-        settings.download_threshold_mbps = update.download_threshold_mbps
-    if update.upload_threshold_mbps is not None:
-        settings.upload_threshold_mbps = update.upload_threshold_mbps
-    if update.tolerance_percent is not None:
-        settings.tolerance_percent = update.tolerance_percent
-    if update.preferred_server_id is not None:
-        settings.preferred_server_id = update.preferred_server_id
-    if update.manual_trigger_cooldown_seconds is not None:
-        settings.manual_trigger_cooldown_seconds = update.manual_trigger_cooldown_seconds
-    if update.theme is not None:
-        settings.theme = update.theme
-    if update.isp_name is not None:
-        settings.isp_name = update.isp_name
-    if update.data_retention_days is not None:
-        settings.data_retention_days = update.data_retention_days
-    if update.webhook_url is not None:
-        settings.webhook_url = update.webhook_url
-
-    settings.save_config()
+    global _config_cache
+    changes = update.model_dump(exclude_none=True)
+    for field, value in changes.items():
+        setattr(settings, field, value)
+    needs_reschedule = not _RESCHEDULE_FIELDS.isdisjoint(changes)
+
+    _schedule_save()
 
     if needs_reschedule:
         scheduler_service.reschedule(
@@ -68,20 +93,5 @@ async def update_config(request: Request, update: ConfigUpdate):
             randomize=settings.scheduler_randomize,
         )
 
-    return ConfigOut(
-        test_interval_minutes=settings.test_interval_minutes,
-        download_threshold_mbps=settings.download_threshold_mbps,
-        upload_threshold_mbps=settings.upload_threshold_mbps,
-        tolerance_percent=settings.tolerance_percent,
-        preferred_server_id=settings.preferred_server_id,
-        manual_trigger_cooldown_seconds=settings.manual_trigger_cooldown_seconds,
-        theme=settings.theme,
-        isp_name=settings.isp_name,
-        data_retention_days=settings.data_retention_days,
-        webhook_url=settings.webhook_url,
-        scheduler_randomize=settings.scheduler_randomize,
-        host=settings.host,
-        port=settings.port,
-        log_level=settings.log_level,
-        debug=settings.debug,
-    )
+    _config_cache = _build_config_out()
+    return _config_cache
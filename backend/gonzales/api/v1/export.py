@@ -1,17 +1,50 @@
-from datetime import datetime
+from collections.abc import AsyncIterator
+from datetime import date, datetime
 
 from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from gonzales.api.dependencies import get_db
 from gonzales.core.rate_limit import RATE_LIMITS, limiter
+from gonzales.db.engine import async_session
 from gonzales.db.repository import MeasurementRepository
 from gonzales.services.export_service import export_service
 from gonzales.services.statistics_service import statistics_service
 
 router = APIRouter(prefix="/export", tags=["export"])
 
+# Response headers are only read by Starlette, so the dicts can be shared
+_CSV_HEADERS = {"Content-Disposition": "attachment; filename=gonzales_export.csv"}
+_PDF_HEADERS = {"Content-Disposition": "attachment; filename=gonzales_report.pdf"}
+
+_report_headers: tuple[date, dict[str, str]] | None = None
+
+
+def _professional_report_headers() -> dict[str, str]:
+    """Return the report download headers, rebuilt once per day."""
+    global _report_headers
+    today = date.today()
+    if _report_headers is None or _report_headers[0] != today:
+        filename = f"gonzales_compliance_report_{today.strftime('%Y%m%d')}.pdf"
+        _report_headers = (today, {"Content-Disposition": f"attachment; filename={filename}"})
+    return _report_headers[1]
+
+
+async def _stream_csv(
+    start_date: datetime | None, end_date: datetime | None
+) -> AsyncIterator[str]:
+    """Yield the CSV export batch by batch.
+
+    Uses its own session because the body is produced after the endpoint
+    has returned and request-scoped dependencies may already be closed.
+    """
+    yield export_service.csv_header()
+    async with async_session() as session:
+        repo = MeasurementRepository(session)
+        async for batch in repo.iter_in_range(start_date, end_date):
+            yield export_service.csv_rows(batch)
+
 
 @router.get("/csv")
 @limiter.limit(RATE_LIMITS["export"])
@@ -19,15 +52,11 @@ async def export_csv(
     request: Request,
     start_date: datetime | None = Query(default=None),
     end_date: datetime | None = Query(default=None),
-    session: AsyncSession = Depends(get_db),
 ):
-    repo = MeasurementRepository(session)
-    measurements = await repo.get_all_in_range(start_date, end_date)
-    csv_content = export_service.generate_csv(measurements)
-    return Response(
-        content=csv_content,
+    return StreamingResponse(
+        _stream_csv(start_date, end_date),
         media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=gonzales_export.csv"},
+        headers=_CSV_HEADERS,
     )
 
 
@@ -60,7 +89,7 @@ async def export_pdf(
     return Response(
         content=pdf_content,
         media_type="application/pdf",
-        headers={"Content-Disposition": "attachment; filename=gonzales_report.pdf"},
+        headers=_PDF_HEADERS,
     )
 
 
@@ -91,9 +120,8 @@ async def export_professional_report(
     pdf_content = export_service.generate_professional_report(
         measurements, enhanced_dict, start_date, end_date
     )
-    filename = f"gonzales_compliance_report_{datetime.now().strftime('%Y%m%d')}.pdf"
     return Response(
         content=pdf_content,
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        headers=_professional_report_headers(),
     )
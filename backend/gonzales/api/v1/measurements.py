@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from gonzales.api.dependencies import get_db, require_api_key
@@ -11,6 +12,11 @@ from gonzales.services.measurement_service import measurement_service
 
 router = APIRouter(prefix="/measurements", tags=["measurements"])
 
+# Validates a whole page of ORM rows in one pydantic-core call
+_MEASUREMENT_LIST_ADAPTER = TypeAdapter(list[MeasurementOut])
+
+_CONFIRM_REQUIRED = HTTPException(status_code=400, detail="Confirmation required: set confirm=true")
+
 
 @router.get(
     "",
@@ -48,9 +54,9 @@ async def list_measurements(
     items, total = await measurement_service.get_paginated(
         session, page, page_size, start_date, end_date, sort_by.value, sort_order.value
     )
-    pages = (total + page_size - 1) // page_size if total > 0 else 0
+    pages = -(-total // page_size)  # ceiling division; 0 when total is 0
     return MeasurementPage(
-        items=[MeasurementOut.model_validate(m) for m in items],
+        items=_MEASUREMENT_LIST_ADAPTER.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
@@ -83,10 +89,7 @@ async def list_measurements(
     response_description="Latest measurement or null if no tests exist"
 )
 async def get_latest_measurement(session: AsyncSession = Depends(get_db)):
-    m = await measurement_service.get_latest(session)
-    if m is None:
-        return None
-    return MeasurementOut.model_validate(m)
+    return await measurement_service.get_latest_out(session)
 
 
 @router.get("/{measurement_id}", response_model=MeasurementOut)
@@ -105,7 +108,7 @@ async def delete_all_measurements(
     session: AsyncSession = Depends(get_db),
 ):
     if not confirm:
-        raise HTTPException(status_code=400, detail="Confirmation required: set confirm=true")
+        raise _CONFIRM_REQUIRED.with_traceback(None)
     count = await measurement_service.delete_all(session)
     return {"deleted": count, "message": f"Deleted {count} measurements"}
 
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from gonzales.api.dependencies import get_db
@@ -9,6 +10,9 @@ from gonzales.schemas.status import OutageListResponse, OutageRecord, OutageStat
 
 router = APIRouter(prefix="/outages", tags=["outages"])
 
+# Validates all ORM rows in one pydantic-core call
+_OUTAGE_LIST_ADAPTER = TypeAdapter(list[OutageRecord])
+
 
 @router.get("", response_model=OutageListResponse)
 async def list_outages(
@@ -20,18 +24,7 @@ async def list_outages(
     repo = OutageRepository(session)
     outages = await repo.get_in_range(start_date, end_date)
 
-    items = [
-        OutageRecord(
-            id=o.id,
-            started_at=o.started_at,
-            ended_at=o.ended_at,
-            duration_seconds=o.duration_seconds,
-            failure_count=o.failure_count,
-            trigger_error=o.trigger_error,
-            is_active=o.ended_at is None,
-        )
-        for o in outages
-    ]
+    items = _OUTAGE_LIST_ADAPTER.validate_python(outages, from_attributes=True)
 
     return OutageListResponse(items=items, total=len(items))
 
@@ -1,7 +1,9 @@
 """QoS (Quality of Service) API endpoints."""
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from gonzales.api.dependencies import get_db
@@ -11,11 +13,19 @@ from gonzales.services.qos_service import qos_service
 
 router = APIRouter(prefix="/qos", tags=["qos"])
 
+# QoS profiles are static definitions, so their JSON is encoded only once
+_profiles_json: bytes | None = None
+
 
 @router.get("/profiles", response_model=list[QosProfileOut])
 async def get_qos_profiles():
     """Get all available QoS profiles with their requirements."""
-    return qos_service.get_all_profiles()
+    global _profiles_json
+    if _profiles_json is None:
+        _profiles_json = TypeAdapter(list[QosProfileOut]).dump_json(
+            qos_service.get_all_profiles()
+        )
+    return Response(content=_profiles_json, media_type="application/json")
 
 
 @router.get("/current", response_model=QosOverview | None)
@@ -46,7 +56,7 @@ async def get_qos_history(
     session: AsyncSession = Depends(get_db),
 ):
     """Get QoS compliance history for a specific profile."""
-    start_date = datetime.now() - timedelta(days=days)
+    start_date = datetime.fromtimestamp(time.time() - days * 86400)
     measurements = await measurement_service.get_all_in_range(session, start_date, None)
 
     result = qos_service.get_profile_history(measurements, profile_id)
@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from gonzales.db.engine import get_session
+from gonzales.api.dependencies import get_db
 from gonzales.schemas.root_cause import (
     RootCauseAnalysis,
     RootCauseRequest,
@@ -19,7 +19,7 @@ async def get_root_cause_analysis(
     min_confidence: float = Query(
         default=0.5, ge=0.0, le=1.0, description="Minimum confidence for fingerprints"
     ),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_db),
 ) -> RootCauseAnalysis:
     """Get comprehensive root-cause analysis.
 
@@ -40,7 +40,7 @@ async def get_root_cause_analysis(
 @router.post("/analysis", response_model=RootCauseAnalysis)
 async def run_root_cause_analysis(
     request: RootCauseRequest,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_db),
 ) -> RootCauseAnalysis:
     """Run root-cause analysis with custom parameters.
 
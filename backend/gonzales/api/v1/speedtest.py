@@ -1,18 +1,70 @@
 import asyncio
-import json
-from typing import Any
+import time
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from gonzales.api.dependencies import require_api_key
-from gonzales.core.rate_limit import RATE_LIMITS, limiter
+from gonzales.core.rate_limit import RATE_LIMITS, get_identifier
 from gonzales.db.engine import async_session
-from gonzales.services.event_bus import event_bus
+from gonzales.middleware.rate_limit import TokenBucket
+from gonzales.services.event_bus import event_bus, is_final_frame
 from gonzales.services.measurement_service import measurement_service
 
 router = APIRouter(prefix="/speedtest", tags=["speedtest"])
 
+# Fixed trigger response bodies, encoded once. A new Response is still built
+# per request since middleware may append to a response's header list.
+_BUSY_BODY = b'{"detail":"A speed test is already in progress"}'
+_STARTED_BODY = (
+    b'{"status":"started","message":"Speed test started. '
+    b'Monitor progress via /speedtest/stream or poll /status."}'
+)
+
+# Per-client token buckets for /trigger, checked inline instead of through
+# slowapi's limiter. The configured limit has the form "<count>/minute".
+# At most _MAX_TRIGGER_BUCKETS clients are tracked at once.
+_TRIGGER_PER_MINUTE = int(RATE_LIMITS["speedtest_trigger"].split("/")[0])
+_TRIGGER_LIMITED_BODY = (
+    f'{{"error":"Rate limit exceeded: {_TRIGGER_PER_MINUTE} per 1 minute"}}'.encode()
+)
+_MAX_TRIGGER_BUCKETS = 256
+_trigger_buckets: dict[str, TokenBucket] = {}
+
+
+def _trigger_bucket(client: str) -> TokenBucket:
+    """Return the client's trigger bucket, creating it on first use."""
+    bucket = _trigger_buckets.get(client)
+    if bucket is None:
+        if len(_trigger_buckets) >= _MAX_TRIGGER_BUCKETS:
+            # Buckets idle for a full window have refilled and can be dropped
+            idle_before = time.monotonic() - 60
+            for key in [k for k, b in _trigger_buckets.items() if b.last_update < idle_before]:
+                del _trigger_buckets[key]
+            if len(_trigger_buckets) >= _MAX_TRIGGER_BUCKETS:
+                # None idle: drop the least recently used to keep the cap
+                del _trigger_buckets[
+                    min(_trigger_buckets, key=lambda k: _trigger_buckets[k].last_update)
+                ]
+        bucket = TokenBucket(
+            capacity=_TRIGGER_PER_MINUTE,
+            refill_rate=_TRIGGER_PER_MINUTE / 60.0,
+        )
+        _trigger_buckets[client] = bucket
+    return bucket
+
+
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+    "X-Content-Type-Options": "nosniff",
+}
+
+# Strong references to running background tests; the event loop only keeps
+# weak references, so an unreferenced task could be garbage collected.
+_background_tasks: set[asyncio.Task[None]] = set()
+
 
 async def _run_test_background(manual: bool = True) -> None:
     """Run speedtest in background with its own database session."""
@@ -56,14 +108,19 @@ async def _run_test_background(manual: bool = True) -> None:
     """,
     response_description="Test started acknowledgment"
 )
-@limiter.limit(RATE_LIMITS["speedtest_trigger"])
 async def trigger_speedtest(request: Request):
+    bucket = _trigger_bucket(get_identifier(request))
+    if not bucket.consume():
+        return Response(
+            content=_TRIGGER_LIMITED_BODY,
+            status_code=429,
+            media_type="application/json",
+            headers={"Retry-After": str(bucket.retry_after)},
+        )
+
     # Mark test as starting immediately (also checks if already in progress)
     if not measurement_service.mark_test_starting():
-        return JSONResponse(
-            status_code=503,
-            content={"detail": "A speed test is already in progress"}
-        )
+        return Response(content=_BUSY_BODY, status_code=503, media_type="application/json")
 
     # Publish "started" event immediately so frontend can show progress
     event_bus.publish({
@@ -72,48 +129,50 @@ async def trigger_speedtest(request: Request):
     })
 
     # Start test in background (fire-and-forget)
-    asyncio.create_task(_run_test_background(manual=True))
+    task = asyncio.create_task(_run_test_background(manual=True))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
-    return {"status": "started", "message": "Speed test started. Monitor progress via /speedtest/stream or poll /status."}
+    return Response(content=_STARTED_BODY, status_code=202, media_type="application/json")
 
 
 @router.get("/stream")
 async def stream_speedtest():
     async def event_generator():
         # Immediate heartbeat to flush proxy buffers
-        yield ": ok\n\n"
-
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-
-        if event_bus._last_event is not None:
-            queue.put_nowait(event_bus._last_event)
-
-        if len(event_bus._subscribers) >= 20:
-            yield 'event: error\ndata: {"message": "Too many connections"}\n\n'
+        yield b": ok\n\n"
+
+        # Read the replay frame and register without awaiting in between, so
+        # no event is missed or delivered twice
+        replay = event_bus.last_frame
+        queue = event_bus.add_frame_subscriber()
+        if queue is None:
+            yield b'event: error\ndata: {"message": "Too many connections"}\n\n'
             return
 
-        event_bus._subscribers.append(queue)
         try:
-            deadline = asyncio.get_event_loop().time() + 300  # 5 min max
-            while asyncio.get_event_loop().time() < deadline:
+            # Replay the current state so late subscribers catch up
+            if replay is not None:
+                yield replay
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 300  # 5 min max
+            while loop.time() < deadline:
                 try:
-                    event = await asyncio.wait_for(queue.get(), timeout=15)
+                    frame = await asyncio.wait_for(queue.get(), timeout=15)
                 except asyncio.TimeoutError:
                     # Send keepalive to prevent proxy idle timeout
-                    yield ": keepalive\n\n"
+                    yield b": keepalive\n\n"
                     continue
 
-                name = event.get("event", "message")
-                data = json.dumps(event.get("data", {}))
-                yield f"event: {name}\ndata: {data}\n\n"
+                yield frame
 
-                if event.get("event") in ("complete", "error"):
+                if is_final_frame(frame):
                     break
         except asyncio.CancelledError:
             pass
         finally:
-            if queue in event_bus._subscribers:
-                event_bus._subscribers.remove(queue)
+            event_bus.remove_frame_subscriber(queue)
 
     # Use application/octet-stream to bypass HA Core's ingress compression.
     # HA Core's should_compress() applies deflate to text/event-stream,
@@ -122,10 +181,5 @@ async def stream_speedtest():
     return StreamingResponse(
         event_generator(),
         media_type="application/octet-stream",
-        headers={
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-            "X-Content-Type-Options": "nosniff",
-        },
+        headers=_SSE_HEADERS,
     )
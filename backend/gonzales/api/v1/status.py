@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 
@@ -7,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from gonzales.api.dependencies import get_db
 from gonzales.config import settings
-from gonzales.db.models import TestFailure
+from gonzales.db.models import Measurement, TestFailure
 from gonzales.schemas.status import (
     OutageStatus,
     SchedulerControlRequest,
@@ -25,26 +26,79 @@ router = APIRouter(prefix="/status", tags=["status"])
 
 _start_time = time.time()
 
+# Latest test time and both row counts in a single round-trip
+_STATUS_QUERY = select(
+    select(func.max(Measurement.timestamp)).scalar_subquery(),
+    select(func.count(Measurement.id)).scalar_subquery(),
+    select(func.count(TestFailure.id)).scalar_subquery(),
+)
+
+# Database file size is re-read at most this often while /status is polled
+_DB_SIZE_TTL_SECONDS = 5.0
+_db_size_cache: tuple[float, int] | None = None
+
+
+def _db_size() -> int:
+    """Return the database file size in bytes (0 if missing), briefly cached."""
+    global _db_size_cache
+    now = time.monotonic()
+    if _db_size_cache is not None and now - _db_size_cache[0] < _DB_SIZE_TTL_SECONDS:
+        return _db_size_cache[1]
+    try:
+        size = os.stat(settings.db_path).st_size
+    except FileNotFoundError:
+        size = 0
+    _db_size_cache = (now, size)
+    return size
+
+
+# Concurrent /status polls share one build per window: a fresh cached result
+# is returned directly, otherwise callers await the build already running.
+_STATUS_TTL_SECONDS = 0.5
+_status_cache: tuple[float, StatusOut] | None = None
+_status_inflight: asyncio.Future[StatusOut] | None = None
+
 
 @router.get("", response_model=StatusOut)
 async def get_status(session: AsyncSession = Depends(get_db)):
-    latest = await measurement_service.get_latest(session)
-    total_measurements = await measurement_service.count(session)
+    global _status_cache, _status_inflight
+    cached = _status_cache
+    if cached is not None and time.monotonic() - cached[0] < _STATUS_TTL_SECONDS:
+        return cached[1]
+    if _status_inflight is not None:
+        return await asyncio.shield(_status_inflight)
+
+    inflight = _status_inflight = asyncio.get_running_loop().create_future()
+    try:
+        status_out = await _build_status(session)
+    except BaseException as exc:
+        if isinstance(exc, asyncio.CancelledError):
+            inflight.cancel()
+        else:
+            inflight.set_exception(exc)
+            inflight.exception()  # waiters re-raise it; don't log as unretrieved
+        raise
+    else:
+        _status_cache = (time.monotonic(), status_out)
+        inflight.set_result(status_out)
+        return status_out
+    finally:
+        _status_inflight = None
 
-    failure_count_result = await session.execute(
-        select(func.count(TestFailure.id))
-    )
-    total_failures = failure_count_result.scalar_one()
 
-    db_size = 0
-    if settings.db_path.exists():
-        db_size = os.path.getsize(settings.db_path)
+async def _build_status(session: AsyncSession) -> StatusOut:
+    result = await session.execute(_STATUS_QUERY)
+    last_test_time, total_measurements, total_failures = result.one()
+
+    db_size = _db_size()
 
     # Get outage status from scheduler
     outage_data = scheduler_service.outage_status
 
+    scheduler = scheduler_service.snapshot()
+
     # Get live test progress from event bus (if test is running)
-    test_in_progress = measurement_service.test_in_progress or scheduler_service.test_in_progress
+    test_in_progress = measurement_service.test_in_progress or scheduler.test_in_progress
     test_progress = None
     if test_in_progress and event_bus._last_event is not None:
         evt_data = event_bus._last_event.get("data", {})
@@ -61,10 +115,10 @@ async def get_status(session: AsyncSession = Depends(get_db)):
     return StatusOut(
         version=__version__,
         scheduler=SchedulerStatus(
-            running=scheduler_service.running,
-            enabled=scheduler_service.enabled,
-            paused=scheduler_service.paused,
-            next_run_time=scheduler_service.next_run_time if scheduler_service.enabled else None,
+            running=scheduler.running,
+            enabled=scheduler.enabled,
+            paused=scheduler.paused,
+            next_run_time=scheduler.next_run_time,
             interval_minutes=settings.test_interval_minutes,
             test_in_progress=test_in_progress,
         ),
@@ -75,7 +129,7 @@ async def get_status(session: AsyncSession = Depends(get_db)):
             consecutive_failures=outage_data["consecutive_failures"],
             last_failure_message=outage_data["last_failure_message"],
         ),
-        last_test_time=latest.timestamp if latest else None,
+        last_test_time=last_test_time,
         total_measurements=total_measurements,
         total_failures=total_failures,
         uptime_seconds=round(time.time() - _start_time, 1),
@@ -90,7 +144,9 @@ async def set_scheduler_enabled(request: SchedulerControlRequest):
     When disabled (paused), scheduled speed tests will be skipped.
     Manual tests can still be triggered via the /speedtest/trigger endpoint.
     """
+    global _status_cache
     changed = scheduler_service.set_enabled(request.enabled)
+    _status_cache = None  # the next /status poll must show the new state
     action = "enabled" if request.enabled else "disabled"
     message = f"Scheduler {action}" if changed else f"Scheduler already {action}"
 
@@ -5,19 +5,23 @@ Provides a structured, human-readable summary of the current
 internet connection status and statistics.
 """
 
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Literal
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from gonzales.api.dependencies import get_db
 from gonzales.config import settings
 from gonzales.core.rate_limit import RATE_LIMITS, limiter
-from gonzales.db.repository import OutageRepository
+from gonzales.db.repository import MeasurementRepository
 from gonzales.services.measurement_service import measurement_service
-from gonzales.services.statistics_service import statistics_service
+from gonzales.services.scheduler_service import scheduler_service
 
 router = APIRouter(prefix="/summary", tags=["summary"])
 
@@ -100,6 +104,22 @@ class SummaryResponse(BaseModel):
     }
 
 
+# Markdown decorations, keyed by enum member
+_STATUS_TITLES = {status: status.value.title() for status in ConnectionStatus}
+_STATUS_EMOJI = {
+    ConnectionStatus.HEALTHY: "✓",
+    ConnectionStatus.DEGRADED: "⚠",
+    ConnectionStatus.POOR: "✗",
+    ConnectionStatus.OUTAGE: "🔴",
+    ConnectionStatus.UNKNOWN: "?",
+}
+_ALERT_ICONS = {
+    AlertType.CRITICAL: "🔴",
+    AlertType.WARNING: "⚠️",
+    AlertType.INFO: "ℹ️",
+}
+
+
 def _determine_status(
     latest: LatestTestSummary | None,
     stats: Statistics7d | None,
@@ -117,6 +137,31 @@ def _determine_status(
     return ConnectionStatus.HEALTHY
 
 
+# Summary sentences per status. OUTAGE and UNKNOWN do not depend on the
+# latest test; the others are filled in with its speeds.
+_FIXED_SUMMARIES = {
+    ConnectionStatus.OUTAGE: (
+        "Internet connection is currently experiencing an outage. Tests are failing."
+    ),
+    ConnectionStatus.UNKNOWN: (
+        "No speed test data available yet. Run a test to check your connection."
+    ),
+}
+_SUMMARY_TEMPLATES = {
+    ConnectionStatus.HEALTHY: (
+        "Internet connection is performing well. Current speed: {speed_desc}."
+    ),
+    ConnectionStatus.DEGRADED: (
+        "Internet connection is degraded. Current speed: {speed_desc}. "
+        "Reliability has dropped below 90% in the last 7 days."
+    ),
+    ConnectionStatus.POOR: (
+        "Internet connection is below expectations. Current speed: {speed_desc}. "
+        "This is below your configured threshold of {threshold_down:.0f} Mbps download."
+    ),
+}
+
+
 def _generate_summary(
     status: ConnectionStatus,
     latest: LatestTestSummary | None,
@@ -125,30 +170,24 @@ def _generate_summary(
     threshold_up: float
 ) -> str:
     """Generate human-readable summary text."""
-    if status == ConnectionStatus.OUTAGE:
-        return "Internet connection is currently experiencing an outage. Tests are failing."
-
-    if status == ConnectionStatus.UNKNOWN:
-        return "No speed test data available yet. Run a test to check your connection."
+    fixed = _FIXED_SUMMARIES.get(status)
+    if fixed is not None:
+        return fixed
 
     if not latest:
         return "No recent test data available."
 
     speed_desc = f"{latest.download_mbps:.1f} Mbps down, {latest.upload_mbps:.1f} Mbps up, {latest.ping_ms:.0f}ms ping"
-
-    if status == ConnectionStatus.HEALTHY:
-        base = f"Internet connection is performing well. Current speed: {speed_desc}."
-        if latest.download_mbps > threshold_down * 1.2:
-            base += f" This exceeds your configured threshold of {threshold_down:.0f} Mbps by {((latest.download_mbps / threshold_down) - 1) * 100:.0f}%."
-        return base
-
-    if status == ConnectionStatus.DEGRADED:
-        return f"Internet connection is degraded. Current speed: {speed_desc}. Reliability has dropped below 90% in the last 7 days."
-
-    if status == ConnectionStatus.POOR:
-        return f"Internet connection is below expectations. Current speed: {speed_desc}. This is below your configured threshold of {threshold_down:.0f} Mbps download."
-
-    return f"Current speed: {speed_desc}."
+    template = _SUMMARY_TEMPLATES.get(status, "Current speed: {speed_desc}.")
+    text = template.format(speed_desc=speed_desc, threshold_down=threshold_down)
+
+    if status == ConnectionStatus.HEALTHY and latest.download_mbps > threshold_down * 1.2:
+        excess_pct = (latest.download_mbps / threshold_down - 1) * 100
+        text += (
+            f" This exceeds your configured threshold of {threshold_down:.0f} Mbps"
+            f" by {excess_pct:.0f}%."
+        )
+    return text
 
 
 def _generate_alerts(
@@ -160,25 +199,25 @@ def _generate_alerts(
     alerts = []
 
     if outage_active:
-        alerts.append(Alert(
+        alerts.append(Alert.model_construct(
             type=AlertType.CRITICAL,
             message="Network outage detected. Speed tests are failing."
         ))
 
     if latest and not latest.meets_threshold:
-        alerts.append(Alert(
+        alerts.append(Alert.model_construct(
             type=AlertType.WARNING,
             message="Current speed is below your configured threshold."
         ))
 
     if stats:
         if stats.reliability_percent < 80:
-            alerts.append(Alert(
+            alerts.append(Alert.model_construct(
                 type=AlertType.WARNING,
                 message=f"Network reliability is only {stats.reliability_percent:.1f}% over the last 7 days."
             ))
         if stats.outage_count > 0:
-            alerts.append(Alert(
+            alerts.append(Alert.model_construct(
                 type=AlertType.INFO,
                 message=f"{stats.outage_count} outage(s) detected in the last 7 days."
             ))
@@ -213,54 +252,60 @@ def _generate_recommendations(
 
 def _format_as_markdown(response: SummaryResponse) -> str:
     """Format summary as markdown for LLM context."""
-    status_emoji = {
-        ConnectionStatus.HEALTHY: "✓",
-        ConnectionStatus.DEGRADED: "⚠",
-        ConnectionStatus.POOR: "✗",
-        ConnectionStatus.OUTAGE: "🔴",
-        ConnectionStatus.UNKNOWN: "?"
-    }
-
-    lines = [
-        f"## Internet Status: {response.status.value.title()} {status_emoji.get(response.status, '')}",
-        ""
+    sections = [
+        f"## Internet Status: {_STATUS_TITLES[response.status]} "
+        f"{_STATUS_EMOJI.get(response.status, '')}\n"
     ]
 
     if response.latest_test:
         t = response.latest_test
-        lines.extend([
-            f"**Latest Test** ({t.timestamp}):",
-            f"- Download: {t.download_mbps:.1f} Mbps {'✓' if t.meets_threshold else '✗'}",
-            f"- Upload: {t.upload_mbps:.1f} Mbps",
-            f"- Ping: {t.ping_ms:.0f} ms",
-            ""
-        ])
+        sections.append(
+            f"**Latest Test** ({t.timestamp}):\n"
+            f"- Download: {t.download_mbps:.1f} Mbps {'✓' if t.meets_threshold else '✗'}\n"
+            f"- Upload: {t.upload_mbps:.1f} Mbps\n"
+            f"- Ping: {t.ping_ms:.0f} ms\n"
+        )
 
     if response.statistics_7d:
-        s = response.statistics_7d
-        lines.extend([
-            "**7-Day Statistics:**",
-            f"- Average Download: {s.avg_download:.1f} Mbps",
-            f"- Average Upload: {s.avg_upload:.1f} Mbps",
-            f"- Reliability: {s.reliability_percent:.1f}%",
-            f"- Tests: {s.test_count}",
-            f"- Outages: {s.outage_count}",
-            ""
-        ])
+        st = response.statistics_7d
+        sections.append(
+            "**7-Day Statistics:**\n"
+            f"- Average Download: {st.avg_download:.1f} Mbps\n"
+            f"- Average Upload: {st.avg_upload:.1f} Mbps\n"
+            f"- Reliability: {st.reliability_percent:.1f}%\n"
+            f"- Tests: {st.test_count}\n"
+            f"- Outages: {st.outage_count}\n"
+        )
 
     if response.alerts:
-        lines.append("**Alerts:**")
-        for alert in response.alerts:
-            icon = {"critical": "🔴", "warning": "⚠️", "info": "ℹ️"}.get(alert.type.value, "•")
-            lines.append(f"- {icon} {alert.message}")
-        lines.append("")
+        alert_lines = "\n".join(
+            f"- {_ALERT_ICONS.get(alert.type, '•')} {alert.message}"
+            for alert in response.alerts
+        )
+        sections.append(f"**Alerts:**\n{alert_lines}\n")
 
     if response.recommendations:
-        lines.append("**Recommendations:**")
-        for rec in response.recommendations:
-            lines.append(f"- {rec}")
+        rec_lines = "\n".join(f"- {rec}" for rec in response.recommendations)
+        sections.append(f"**Recommendations:**\n{rec_lines}")
+
+    return "\n".join(sections)
+
+
+# The summary only changes when measurements, the outage state or the
+# thresholds change, so a built response (and its markdown rendering) is
+# reused while that key matches, for at most _SUMMARY_TTL_SECONDS.
+_SUMMARY_TTL_SECONDS = 10.0
+
+
+@dataclass(slots=True)
+class _SummaryCacheEntry:
+    created_at: float
+    key: tuple
+    response: SummaryResponse
+    markdown: str | None = None
+
 
-    return "\n".join(lines)
+_summary_cache: _SummaryCacheEntry | None = None
 
 
 @router.get(
@@ -293,7 +338,7 @@ def _format_as_markdown(response: SummaryResponse) -> str:
 async def get_summary(
     request: Request,
     format: Literal["json", "markdown"] = Query("json", description="Response format"),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_db),
 ):
     """
     Get a comprehensive summary of internet connection status.
@@ -301,64 +346,83 @@ async def get_summary(
     Designed for AI agents and LLMs to quickly understand the current
     state of the monitored internet connection.
     """
-    from datetime import datetime, timedelta, timezone
+    global _summary_cache
+    # Check for active outage
+    outage_active = scheduler_service.outage_status.get("outage_active", False)
+    key = (
+        measurement_service.data_version,
+        outage_active,
+        settings.download_threshold_mbps,
+        settings.upload_threshold_mbps,
+        settings.tolerance_percent,
+    )
+    now = time.monotonic()
+    cached = _summary_cache
+    if (
+        cached is not None
+        and cached.key == key
+        and now - cached.created_at < _SUMMARY_TTL_SECONDS
+    ):
+        entry = cached
+    else:
+        response = await _build_summary(session, outage_active)
+        entry = _summary_cache = _SummaryCacheEntry(now, key, response)
+
+    # Return markdown if requested
+    if format == "markdown":
+        if entry.markdown is None:
+            entry.markdown = _format_as_markdown(entry.response)
+        return PlainTextResponse(
+            content=entry.markdown,
+            media_type="text/markdown"
+        )
+
+    return entry.response
 
-    # Get latest measurement
-    latest_measurement = await measurement_service.get_latest(session)
 
-    # Get 7-day statistics
+async def _build_summary(session: AsyncSession, outage_active: bool) -> SummaryResponse:
+    """Query the data behind the summary and assemble the response."""
+    # 7-day window
     end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=7)
 
-    basic_stats = await statistics_service.compute_basic(
-        session,
-        start_date=start_date,
-        end_date=end_date
-    )
-
-    # Get outages
-    outage_repo = OutageRepository(session)
-    outages = await outage_repo.get_in_range(start_date, end_date)
+    # Latest test and window aggregates come back in a single row
+    window = await MeasurementRepository(session).get_summary_snapshot(start_date, end_date)
 
-    # Calculate effective thresholds
-    tolerance = settings.tolerance_percent / 100
-    effective_download = settings.download_threshold_mbps * (1 - tolerance)
-    effective_upload = settings.upload_threshold_mbps * (1 - tolerance)
+    effective_download = settings.effective_download_threshold_mbps
+    effective_upload = settings.effective_upload_threshold_mbps
 
     # Build latest test summary
     latest_test = None
-    if latest_measurement:
+    if window["latest_timestamp"] is not None:
         meets_threshold = (
-            latest_measurement.download_mbps >= effective_download and
-            latest_measurement.upload_mbps >= effective_upload
+            window["latest_download"] >= effective_download and
+            window["latest_upload"] >= effective_upload
         )
-        latest_test = LatestTestSummary(
-            timestamp=latest_measurement.timestamp.isoformat(),
-            download_mbps=round(latest_measurement.download_mbps, 1),
-            upload_mbps=round(latest_measurement.upload_mbps, 1),
-            ping_ms=round(latest_measurement.ping_latency_ms, 1),
+        latest_test = LatestTestSummary.model_construct(
+            timestamp=window["latest_timestamp"].isoformat(),
+            download_mbps=round(window["latest_download"], 1),
+            upload_mbps=round(window["latest_upload"], 1),
+            ping_ms=round(window["latest_ping"], 1),
             meets_threshold=meets_threshold
         )
 
     # Build 7-day statistics
     stats_7d = None
-    if basic_stats and basic_stats.total_tests > 0:
-        compliant_tests = basic_stats.total_tests - basic_stats.download_violations
-        reliability = (compliant_tests / basic_stats.total_tests) * 100 if basic_stats.total_tests > 0 else 0
-
-        stats_7d = Statistics7d(
-            avg_download=round(basic_stats.download.avg, 1) if basic_stats.download else 0,
-            avg_upload=round(basic_stats.upload.avg, 1) if basic_stats.upload else 0,
-            avg_ping=round(basic_stats.ping.avg, 1) if basic_stats.ping else 0,
+    total_tests = window["total_tests"]
+    if total_tests:
+        # download_violations is a non-null SUM whenever the window has tests
+        reliability = (total_tests - window["download_violations"]) * 100.0 / total_tests
+
+        stats_7d = Statistics7d.model_construct(
+            avg_download=round(window["avg_download"], 1),
+            avg_upload=round(window["avg_upload"], 1),
+            avg_ping=round(window["avg_ping"], 1),
             reliability_percent=round(reliability, 1),
-            outage_count=len(outages),
-            test_count=basic_stats.total_tests
+            outage_count=window["outage_count"],
+            test_count=total_tests
         )
 
-    # Check for active outage
-    from gonzales.services.scheduler_service import scheduler_service
-    outage_active = scheduler_service.outage_status.get("outage_active", False)
-
     # Determine status
     status = _determine_status(latest_test, stats_7d, outage_active)
 
@@ -375,7 +439,9 @@ async def get_summary(
     # Generate recommendations
     recommendations = _generate_recommendations(status, latest_test, stats_7d)
 
-    response = SummaryResponse(
+    # Every field is produced above from typed service results, so the
+    # models are constructed without re-running validation
+    return SummaryResponse.model_construct(
         status=status,
         summary=summary_text,
         latest_test=latest_test,
@@ -384,12 +450,3 @@ async def get_summary(
         recommendations=recommendations
     )
 
-    # Return markdown if requested
-    if format == "markdown":
-        from fastapi.responses import PlainTextResponse
-        return PlainTextResponse(
-            content=_format_as_markdown(response),
-            media_type="text/markdown"
-        )
-
-    return response
@@ -1,5 +1,7 @@
 """Network topology analysis API endpoints."""
 import ipaddress
+import socket
+from operator import attrgetter
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,7 +10,9 @@ from gonzales.api.dependencies import get_db
 from gonzales.core.rate_limit import limiter
 from gonzales.schemas.topology import (
     NetworkDiagnosisOut,
+    NetworkHopOut,
     NetworkTopologyOut,
+    TopologyHistoryEntry,
     TopologyHistoryOut,
 )
 from gonzales.services.topology_service import topology_service
@@ -27,6 +31,36 @@ ALLOWED_TARGETS = frozenset({
 })
 
 
+_PRIVATE_DETAIL = "Private IP addresses are not allowed for security reasons"
+_LOOPBACK_DETAIL = "Loopback addresses are not allowed"
+_MULTICAST_DETAIL = "Multicast addresses are not allowed"
+_RESERVED_DETAIL = "Reserved addresses are not allowed"
+
+# Blocked IPv4 ranges as (first, last, detail) integer bounds, so IPv4 targets
+# are checked without building an ipaddress object. The private ranges match
+# what ipaddress.IPv4Address.is_private covers.
+_IPV4_BLOCKED_RANGES = tuple(
+    (int(network.network_address), int(network.broadcast_address), detail)
+    for cidr, detail in (
+        ("127.0.0.0/8", _LOOPBACK_DETAIL),
+        ("224.0.0.0/4", _MULTICAST_DETAIL),
+        ("240.0.0.0/4", _RESERVED_DETAIL),
+        ("0.0.0.0/8", _PRIVATE_DETAIL),
+        ("10.0.0.0/8", _PRIVATE_DETAIL),
+        ("169.254.0.0/16", _PRIVATE_DETAIL),
+        ("172.16.0.0/12", _PRIVATE_DETAIL),
+        ("192.0.0.0/29", _PRIVATE_DETAIL),
+        ("192.0.0.170/31", _PRIVATE_DETAIL),
+        ("192.0.2.0/24", _PRIVATE_DETAIL),
+        ("192.168.0.0/16", _PRIVATE_DETAIL),
+        ("198.18.0.0/15", _PRIVATE_DETAIL),
+        ("198.51.100.0/24", _PRIVATE_DETAIL),
+        ("203.0.113.0/24", _PRIVATE_DETAIL),
+    )
+    for network in (ipaddress.IPv4Network(cidr),)
+)
+
+
 def _validate_target(target: str | None) -> str:
     """Validate and sanitize the target IP address.
 
@@ -46,35 +80,35 @@ def _validate_target(target: str | None) -> str:
     if target in ALLOWED_TARGETS:
         return target
 
-    # Validate IP format and check for private/loopback
+    # Dotted-quad IPv4 is parsed in C and range-checked as an integer
+    try:
+        packed = socket.inet_pton(socket.AF_INET, target)
+    except (OSError, ValueError):
+        packed = None
+    if packed is not None:
+        value = int.from_bytes(packed, "big")
+        for first, last, detail in _IPV4_BLOCKED_RANGES:
+            if first <= value <= last:
+                raise HTTPException(status_code=400, detail=detail)
+        return target
+
+    # Validate IPv6 format and check for private/loopback
     try:
         ip = ipaddress.ip_address(target)
-        if ip.is_private:
-            raise HTTPException(
-                status_code=400,
-                detail="Private IP addresses are not allowed for security reasons"
-            )
-        if ip.is_loopback:
-            raise HTTPException(
-                status_code=400,
-                detail="Loopback addresses are not allowed"
-            )
-        if ip.is_multicast:
-            raise HTTPException(
-                status_code=400,
-                detail="Multicast addresses are not allowed"
-            )
-        if ip.is_reserved:
-            raise HTTPException(
-                status_code=400,
-                detail="Reserved addresses are not allowed"
-            )
-        return str(ip)
     except ValueError:
         raise HTTPException(
             status_code=400,
             detail="Invalid IP address format. Use IPv4 or IPv6 address."
         )
+    if ip.is_loopback:
+        raise HTTPException(status_code=400, detail=_LOOPBACK_DETAIL)
+    if ip.is_multicast:
+        raise HTTPException(status_code=400, detail=_MULTICAST_DETAIL)
+    if ip.is_reserved:
+        raise HTTPException(status_code=400, detail=_RESERVED_DETAIL)
+    if ip.is_private:
+        raise HTTPException(status_code=400, detail=_PRIVATE_DETAIL)
+    return str(ip)
 
 
 @router.post("/analyze", response_model=NetworkTopologyOut)
@@ -109,17 +143,18 @@ async def get_topology_history(
     session: AsyncSession = Depends(get_db),
 ):
     """Get recent topology analyses."""
-    analyses = await topology_service.get_history(session, limit)
-    return TopologyHistoryOut(
+    analyses = await topology_service.get_history_entries(session, limit)
+    # Entries are copied from typed columns, so they skip validation
+    return TopologyHistoryOut.model_construct(
         entries=[
-            {
-                "id": a.id,
-                "timestamp": a.timestamp,
-                "target_host": a.target_host,
-                "total_hops": a.total_hops,
-                "total_latency_ms": a.total_latency_ms,
-                "local_network_ok": a.local_network_ok,
-            }
+            TopologyHistoryEntry.model_construct(
+                id=a.id,
+                timestamp=a.timestamp,
+                target_host=a.target_host,
+                total_hops=a.total_hops,
+                total_latency_ms=a.total_latency_ms,
+                local_network_ok=a.local_network_ok,
+            )
             for a in analyses
         ],
         total=len(analyses),
@@ -148,42 +183,51 @@ async def get_topology(
     return _topology_to_out(topology)
 
 
+# Hop status indexed by (timeout, packet loss > 5 %, latency > 50 ms) bits;
+# a timeout outranks packet loss, which outranks high latency
+_HOP_STATUS = (
+    "ok", "high_latency", "packet_loss", "packet_loss",
+    "timeout", "timeout", "timeout", "timeout",
+)
+
+
 def _get_hop_status(hop) -> str:
     """Determine status for a hop."""
-    if hop.is_timeout:
-        return "timeout"
-    if hop.packet_loss_pct > 5:
-        return "packet_loss"
-    if hop.latency_ms is not None and hop.latency_ms > 50:
-        return "high_latency"
-    return "ok"
+    latency = hop.latency_ms
+    index = (
+        (hop.is_timeout << 2)
+        | ((hop.packet_loss_pct > 5) << 1)
+        | (latency is not None and latency > 50)
+    )
+    return _HOP_STATUS[index]
 
 
 def _topology_to_out(topology) -> NetworkTopologyOut:
     """Convert a NetworkTopology model to output schema."""
-    hops = [
-        {
-            "hop_number": h.hop_number,
-            "ip_address": h.ip_address,
-            "hostname": h.hostname,
-            "latency_ms": h.latency_ms,
-            "packet_loss_pct": h.packet_loss_pct,
-            "is_local": h.is_local,
-            "is_timeout": h.is_timeout,
-            "status": _get_hop_status(h),
-        }
-        for h in sorted(topology.hops, key=lambda x: x.hop_number)
-    ]
-
-    # Find bottleneck hop
-    bottleneck_hop = None
-    valid_hops = [h for h in topology.hops if h.latency_ms is not None]
-    if valid_hops:
-        max_hop = max(valid_hops, key=lambda x: x.latency_ms or 0)
-        if max_hop.latency_ms and max_hop.latency_ms > 20:
-            bottleneck_hop = max_hop.hop_number
-
-    return NetworkTopologyOut(
+    # One pass builds the hop list and tracks the highest-latency hop. Hops are
+    # read from typed ORM columns, so they are constructed without validation.
+    hops = []
+    max_latency = 0.0
+    max_latency_hop = None
+    for h in sorted(topology.hops, key=attrgetter("hop_number")):
+        hops.append(NetworkHopOut.model_construct(
+            hop_number=h.hop_number,
+            ip_address=h.ip_address,
+            hostname=h.hostname,
+            latency_ms=h.latency_ms,
+            packet_loss_pct=h.packet_loss_pct,
+            is_local=h.is_local,
+            is_timeout=h.is_timeout,
+            status=_get_hop_status(h),
+        ))
+        if h.latency_ms is not None and h.latency_ms > max_latency:
+            max_latency = h.latency_ms
+            max_latency_hop = h.hop_number
+
+    # The slowest hop only counts as a bottleneck above 20 ms
+    bottleneck_hop = max_latency_hop if max_latency > 20 else None
+
+    return NetworkTopologyOut.model_construct(
         id=topology.id,
         timestamp=topology.timestamp,
         target_host=topology.target_host,
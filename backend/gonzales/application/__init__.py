@@ -12,10 +12,12 @@ This layer depends on the domain layer but not on infrastructure.
 Infrastructure details are injected via ports.
 """
 
-from gonzales.application.use_cases.run_speedtest import RunSpeedtestUseCase
-from gonzales.application.use_cases.get_statistics import GetStatisticsUseCase
-from gonzales.application.use_cases.manage_config import ManageConfigUseCase
-from gonzales.application.use_cases.export_data import ExportDataUseCase
+from gonzales.application.use_cases import (
+    ExportDataUseCase,
+    GetStatisticsUseCase,
+    ManageConfigUseCase,
+    RunSpeedtestUseCase,
+)
 
 __all__ = [
     "RunSpeedtestUseCase",
@@ -6,18 +6,47 @@ This use case orchestrates:
 2. Formatting data for export (CSV, JSON, PDF)
 3. Generating compliance reports
 """
+import json
+import textwrap
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional, Protocol
-import csv
-import io
-import json
 
 from gonzales.domain.entities import MeasurementEntity
 
+# CSV export layout; rows end in "\r\n" like csv.writer's default dialect
+_CSV_HEADER = (
+    "timestamp,download_mbps,upload_mbps,ping_ms,jitter_ms,packet_loss_pct,"
+    "server_name,server_location,isp,below_download_threshold,"
+    "below_upload_threshold,connection_type\r\n"
+)
+
+
+# json.dumps builds a new encoder per call whenever options are passed, so
+# compact exports share one
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+
+
+def _csv_text(value: str) -> str:
+    """Quote a free-text CSV field the way csv.QUOTE_MINIMAL would."""
+    if "," in value or '"' in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
 
 class MeasurementRepositoryPort(Protocol):
-    """Protocol for measurement access."""
+    """Protocol for measurement access.
+
+    Adapters may also provide ``iter_by_time_range(start, end, batch_size,
+    dl_threshold, ul_threshold)`` yielding lists of entities; exports then
+    hold one batch at a time.
+
+    With use_current_thresholds, dl_threshold/ul_threshold keywords are
+    also passed to iter_by_time_range or get_by_time_range, and the
+    below_*_threshold flags must be computed against them instead of read
+    from the values stored at insert time.
+    """
     async def get_by_time_range(
         self, start: datetime, end: datetime, limit: Optional[int] = None
     ) -> list[MeasurementEntity]: ...
@@ -28,7 +57,7 @@ class ConfigPort(Protocol):
     def get(self, key: str, default=None): ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportDataInput:
     """Input for data export."""
     format: str = "csv"  # csv, json
@@ -36,9 +65,12 @@ class ExportDataInput:
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     include_raw: bool = False
+    pretty: bool = False  # indent JSON output for human readers
+    # Recompute threshold flags against today's thresholds (needs a config)
+    use_current_thresholds: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportDataOutput:
     """Output containing exported data."""
     content: str
@@ -72,107 +104,179 @@ class ExportDataUseCase:
         Returns:
             ExportDataOutput with formatted data
         """
-        # Determine time range
-        end = input_data.end_date or datetime.utcnow()
-        start = input_data.start_date or (end - timedelta(days=input_data.days))
+        record_count = 0
 
-        # Fetch measurements
-        measurements = await self._measurements.get_by_time_range(start, end)
+        async def counted() -> AsyncIterator[list[MeasurementEntity]]:
+            nonlocal record_count
+            async for batch in self._batches(input_data):
+                record_count += len(batch)
+                yield batch
+
+        content = "".join([chunk async for chunk in self._render(input_data, counted())])
 
         # Generate timestamp for filename
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        extension = "json" if input_data.format == "json" else "csv"
+
+        return ExportDataOutput(
+            content=content,
+            content_type="application/json" if extension == "json" else "text/csv",
+            filename=f"gonzales_export_{timestamp}.{extension}",
+            record_count=record_count,
+        )
+
+    async def stream(self, input_data: ExportDataInput) -> AsyncIterator[bytes]:
+        """
+        Export measurements in the requested format as encoded chunks.
+
+        Only one repository batch is held in memory at a time, so the
+        result can be piped straight into a streaming HTTP response.
+
+        Args:
+            input_data: Export options
+
+        Yields:
+            UTF-8 encoded pieces of the export, in order
+        """
+        async for chunk in self._render(input_data, self._batches(input_data)):
+            yield chunk.encode()
+
+    async def _batches(
+        self, input_data: ExportDataInput
+    ) -> AsyncIterator[list[MeasurementEntity]]:
+        """Fetch the requested time range, batched when the adapter allows it."""
+        end = input_data.end_date or datetime.utcnow()
+        start = input_data.start_date or (end - timedelta(days=input_data.days))
+
+        # By default the flags stored at insert time are exported, as the
+        # HTTP and CLI exports do
+        thresholds: dict[str, float] = {}
+        if input_data.use_current_thresholds and self._config:
+            factor = 1 - self._config.get("tolerance_percent", 15.0) / 100
+            dl_threshold = self._config.get("download_threshold_mbps", 100.0)
+            ul_threshold = self._config.get("upload_threshold_mbps", 50.0)
+            thresholds["dl_threshold"] = dl_threshold * factor
+            thresholds["ul_threshold"] = ul_threshold * factor
+
+        iter_by_time_range = getattr(self._measurements, "iter_by_time_range", None)
+        if iter_by_time_range is None:
+            yield await self._measurements.get_by_time_range(start, end, **thresholds)
+            return
+        async for batch in iter_by_time_range(start, end, batch_size=1000, **thresholds):
+            yield batch
 
+    def _render(
+        self,
+        input_data: ExportDataInput,
+        batches: AsyncIterator[list[MeasurementEntity]],
+    ) -> AsyncIterator[str]:
+        """Format batches in the requested export format."""
         if input_data.format == "json":
-            return self._export_json(measurements, timestamp)
+            return self._render_json(batches, pretty=input_data.pretty)
+        return self._render_csv(batches)
+
+    async def _render_csv(
+        self, batches: AsyncIterator[list[MeasurementEntity]]
+    ) -> AsyncIterator[str]:
+        """Render CSV, one chunk per batch.
+
+        Rows are formatted directly; only the text fields can need quoting,
+        so the csv module's per-field checks are skipped. Quoting and the CRLF
+        line ending follow csv.writer's default dialect, but numbers
+        are always written with two decimals (12.5 becomes "12.50").
+        """
+        yield _CSV_HEADER
+        async for batch in batches:
+            yield "".join([self._csv_row(m) for m in batch])
+
+    async def _render_json(
+        self,
+        batches: AsyncIterator[list[MeasurementEntity]],
+        pretty: bool = False,
+    ) -> AsyncIterator[str]:
+        """Render JSON, one chunk per batch.
+
+        The record count is only known once every batch has been written,
+        so it follows the measurements array.
+        """
+        export_timestamp = _COMPACT_JSON.encode(datetime.utcnow().isoformat())
+        if pretty:
+            yield f'{{\n  "export_timestamp": {export_timestamp},\n  "measurements": ['
         else:
-            return self._export_csv(measurements, timestamp)
-
-    def _export_csv(self, measurements: list[MeasurementEntity], timestamp: str) -> ExportDataOutput:
-        """Export as CSV format."""
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow([
-            "timestamp",
-            "download_mbps",
-            "upload_mbps",
-            "ping_ms",
-            "jitter_ms",
-            "packet_loss_pct",
-            "server_name",
-            "server_location",
-            "isp",
-            "below_download_threshold",
-            "below_upload_threshold",
-            "connection_type",
-        ])
-
-        # Data rows
-        for m in measurements:
-            writer.writerow([
-                m.timestamp.isoformat() if m.timestamp else "",
-                round(m.download_mbps, 2),
-                round(m.upload_mbps, 2),
-                round(m.ping_latency_ms, 2),
-                round(m.ping_jitter_ms, 2),
-                round(m.packet_loss_pct, 2) if m.packet_loss_pct else "",
-                m.server_name,
-                m.server_location,
-                m.isp,
-                m.below_download_threshold,
-                m.below_upload_threshold,
-                m.connection_type,
-            ])
+            yield f'{{"export_timestamp":{export_timestamp},"measurements":['
 
-        return ExportDataOutput(
-            content=output.getvalue(),
-            content_type="text/csv",
-            filename=f"gonzales_export_{timestamp}.csv",
-            record_count=len(measurements),
-        )
+        record_count = 0
+        async for batch in batches:
+            if not batch:
+                continue
+            if pretty:
+                records = [
+                    "\n" + textwrap.indent(json.dumps(self._json_record(m), indent=2), "    ")
+                    for m in batch
+                ]
+            else:
+                records = [_COMPACT_JSON.encode(self._json_record(m)) for m in batch]
+            chunk = ",".join(records)
+            yield "," + chunk if record_count else chunk
+            record_count += len(batch)
 
-    def _export_json(self, measurements: list[MeasurementEntity], timestamp: str) -> ExportDataOutput:
-        """Export as JSON format."""
-        data = {
-            "export_timestamp": datetime.utcnow().isoformat(),
-            "record_count": len(measurements),
-            "measurements": [
-                {
-                    "id": m.id,
-                    "timestamp": m.timestamp.isoformat() if m.timestamp else None,
-                    "download_mbps": round(m.download_mbps, 2),
-                    "upload_mbps": round(m.upload_mbps, 2),
-                    "ping_ms": round(m.ping_latency_ms, 2),
-                    "jitter_ms": round(m.ping_jitter_ms, 2),
-                    "packet_loss_pct": round(m.packet_loss_pct, 2) if m.packet_loss_pct else None,
-                    "server": {
-                        "id": m.server_id,
-                        "name": m.server_name,
-                        "location": m.server_location,
-                        "country": m.server_country,
-                    },
-                    "network": {
-                        "isp": m.isp,
-                        "internal_ip": m.internal_ip,
-                        "external_ip": m.external_ip,
-                        "interface": m.interface_name,
-                        "connection_type": m.connection_type,
-                        "is_vpn": m.is_vpn,
-                    },
-                    "compliance": {
-                        "below_download_threshold": m.below_download_threshold,
-                        "below_upload_threshold": m.below_upload_threshold,
-                    },
-                    "result_url": m.result_url,
-                }
-                for m in measurements
-            ],
-        }
+        if pretty:
+            closing = "\n  ]" if record_count else "]"
+            yield f'{closing},\n  "record_count": {record_count}\n}}'
+        else:
+            yield f'],"record_count":{record_count}}}'
 
-        return ExportDataOutput(
-            content=json.dumps(data, indent=2),
-            content_type="application/json",
-            filename=f"gonzales_export_{timestamp}.json",
-            record_count=len(measurements),
+    @staticmethod
+    def _csv_row(m: MeasurementEntity) -> str:
+        """Format one measurement as a CSV row.
+
+        Numbers are rounded by the format spec, so no intermediate float
+        is created per field.
+        """
+        packet_loss = f"{m.packet_loss_pct:.2f}" if m.packet_loss_pct else ""
+        return (
+            f"{m.timestamp.isoformat() if m.timestamp else ''},"
+            f"{m.download_mbps:.2f},"
+            f"{m.upload_mbps:.2f},"
+            f"{m.ping_latency_ms:.2f},"
+            f"{m.ping_jitter_ms:.2f},"
+            f"{packet_loss},"
+            f"{_csv_text(m.server_name)},"
+            f"{_csv_text(m.server_location)},"
+            f"{_csv_text(m.isp)},"
+            f"{m.below_download_threshold},"
+            f"{m.below_upload_threshold},"
+            f"{_csv_text(m.connection_type)}\r\n"
         )
+
+    @staticmethod
+    def _json_record(m: MeasurementEntity) -> dict:
+        """Build the JSON export record for one measurement."""
+        return {
+            "id": m.id,
+            "timestamp": m.timestamp.isoformat() if m.timestamp else None,
+            "download_mbps": round(m.download_mbps, 2),
+            "upload_mbps": round(m.upload_mbps, 2),
+            "ping_ms": round(m.ping_latency_ms, 2),
+            "jitter_ms": round(m.ping_jitter_ms, 2),
+            "packet_loss_pct": round(m.packet_loss_pct, 2) if m.packet_loss_pct else None,
+            "server": {
+                "id": m.server_id,
+                "name": m.server_name,
+                "location": m.server_location,
+                "country": m.server_country,
+            },
+            "network": {
+                "isp": m.isp,
+                "internal_ip": m.internal_ip,
+                "external_ip": m.external_ip,
+                "interface": m.interface_name,
+                "connection_type": m.connection_type,
+                "is_vpn": m.is_vpn,
+            },
+            "compliance": {
+                "below_download_threshold": m.below_download_threshold,
+                "below_upload_threshold": m.below_upload_threshold,
+            },
+            "result_url": m.result_url,
+        }
@@ -10,13 +10,34 @@ This use case orchestrates:
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional, Protocol
-from statistics import mean, median, stdev
+from math import fsum, sqrt
+import time
 
 from gonzales.domain.entities import MeasurementEntity
 
 
+# Results are reused for this long for requests over the same window
+STATISTICS_CACHE_TTL_SECONDS = 30.0
+STATISTICS_CACHE_MAX_ENTRIES = 64
+
+
 class MeasurementRepositoryPort(Protocol):
-    """Protocol for measurement access."""
+    """Protocol for measurement access.
+
+    Adapters may also provide ``get_metric_rows(start, end, dl_threshold,
+    ul_threshold)`` returning (download_mbps, upload_mbps, ping_latency_ms,
+    below_download_threshold, below_upload_threshold) tuples; statistics
+    then skip building entities.
+
+    With use_current_thresholds, dl_threshold/ul_threshold keywords are
+    also passed to get_metric_rows or get_by_time_range, and the
+    below_*_threshold flags must be computed against them instead of read
+    from the values stored at insert time.
+    A ``data_version`` attribute that changes on every insert or delete
+    makes cached results expire as soon as the data changes. Without it,
+    new measurements only show up once the cached result expires or
+    invalidate_cache() is called.
+    """
     async def get_by_time_range(
         self, start: datetime, end: datetime, limit: Optional[int] = None
     ) -> list[MeasurementEntity]: ...
@@ -29,7 +50,7 @@ class ConfigPort(Protocol):
     def get(self, key: str, default=None): ...
 
 
-@dataclass
+@dataclass(slots=True)
 class PercentileValues:
     """Percentile breakdown for a metric."""
     p5: float = 0.0
@@ -39,7 +60,7 @@ class PercentileValues:
     p95: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeedStatistics:
     """Statistics for a speed metric."""
     min: float = 0.0
@@ -50,7 +71,7 @@ class SpeedStatistics:
     percentiles: PercentileValues = field(default_factory=PercentileValues)
 
 
-@dataclass
+@dataclass(slots=True)
 class SlaCompliance:
     """SLA compliance metrics."""
     total_tests: int = 0
@@ -60,15 +81,18 @@ class SlaCompliance:
     upload_compliance_pct: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GetStatisticsInput:
     """Input for statistics retrieval."""
     days: int = 30
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
+    # Count violations against today's thresholds instead of the flags
+    # stored with each measurement (which StatisticsService reports)
+    use_current_thresholds: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class GetStatisticsOutput:
     """Output containing computed statistics."""
     total_tests: int = 0
@@ -92,6 +116,12 @@ class GetStatisticsUseCase:
 
     Computes aggregate statistics, percentiles, and compliance metrics
     for speed test measurements over a specified time period.
+
+    Results are cached for STATISTICS_CACHE_TTL_SECONDS, keyed by the
+    window rounded down to the minute, the thresholds and the repository's
+    data_version (when it has one; otherwise results can be up to the TTL
+    stale). Cached outputs are shared between callers and must not be
+    mutated.
     """
 
     def __init__(
@@ -101,6 +131,12 @@ class GetStatisticsUseCase:
     ):
         self._measurements = measurements
         self._config = config
+        # cache key -> (monotonic time computed, output)
+        self._cache: dict[tuple, tuple[float, GetStatisticsOutput]] = {}
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached results, e.g. after a configuration change."""
+        self._cache.clear()
 
     async def execute(self, input_data: GetStatisticsInput) -> GetStatisticsOutput:
         """
@@ -116,20 +152,96 @@ class GetStatisticsUseCase:
         end = input_data.end_date or datetime.utcnow()
         start = input_data.start_date or (end - timedelta(days=input_data.days))
 
-        # Fetch measurements
-        measurements = await self._measurements.get_by_time_range(start, end)
+        # Read thresholds once; both the empty and the full result use them
+        dl_threshold = self._get_config("download_threshold_mbps", 100.0)
+        ul_threshold = self._get_config("upload_threshold_mbps", 50.0)
+        tolerance = self._get_config("tolerance_percent", 15.0)
+
+        key = (
+            start.replace(second=0, microsecond=0),
+            end.replace(second=0, microsecond=0),
+            dl_threshold,
+            ul_threshold,
+            tolerance,
+            input_data.use_current_thresholds,
+            getattr(self._measurements, "data_version", None),
+        )
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < STATISTICS_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        output = await self._compute(
+            start, end, dl_threshold, ul_threshold, tolerance,
+            input_data.use_current_thresholds,
+        )
+        # Dicts keep insertion order, so the first key is the oldest entry
+        self._cache.pop(key, None)
+        if len(self._cache) >= STATISTICS_CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now, output)
+        return output
+
+    async def _compute(
+        self,
+        start: datetime,
+        end: datetime,
+        dl_threshold: float,
+        ul_threshold: float,
+        tolerance: float,
+        use_current_thresholds: bool = False,
+    ) -> GetStatisticsOutput:
+        """Compute statistics for a time range without consulting the cache."""
+        effective_dl = dl_threshold * (1 - tolerance / 100)
+        effective_ul = ul_threshold * (1 - tolerance / 100)
 
-        if not measurements:
+        # By default violations are the flags stored at insert time, the
+        # same totals StatisticsService reports; on request they are
+        # evaluated against the current thresholds in the query
+        thresholds: dict[str, float] = {}
+        if use_current_thresholds:
+            thresholds["dl_threshold"] = effective_dl
+            thresholds["ul_threshold"] = effective_ul
+
+        # Fetch only the metric columns when the adapter supports it
+        get_metric_rows = getattr(self._measurements, "get_metric_rows", None)
+        if get_metric_rows is not None:
+            rows = await get_metric_rows(start, end, **thresholds)
+        else:
+            measurements = await self._measurements.get_by_time_range(
+                start, end, **thresholds
+            )
+            rows = [
+                (
+                    m.download_mbps,
+                    m.upload_mbps,
+                    m.ping_latency_ms,
+                    m.below_download_threshold,
+                    m.below_upload_threshold,
+                )
+                for m in measurements
+            ]
+
+        if not rows:
             return GetStatisticsOutput(
-                download_threshold_mbps=self._get_config("download_threshold_mbps", 100.0),
-                upload_threshold_mbps=self._get_config("upload_threshold_mbps", 50.0),
-                tolerance_percent=self._get_config("tolerance_percent", 15.0),
+                download_threshold_mbps=dl_threshold,
+                upload_threshold_mbps=ul_threshold,
+                tolerance_percent=tolerance,
             )
 
-        # Extract metric arrays
-        downloads = [m.download_mbps for m in measurements]
-        uploads = [m.upload_mbps for m in measurements]
-        pings = [m.ping_latency_ms for m in measurements]
+        # Extract metric arrays and count violations in a single pass
+        downloads: list[float] = []
+        uploads: list[float] = []
+        pings: list[float] = []
+        dl_violations = 0
+        ul_violations = 0
+        for download, upload, ping, below_download, below_upload in rows:
+            downloads.append(download)
+            uploads.append(upload)
+            pings.append(ping)
+            dl_violations += below_download
+            ul_violations += below_upload
+        total = len(rows)
 
         # Compute statistics
         download_stats = self._compute_speed_stats(downloads)
@@ -137,29 +249,21 @@ class GetStatisticsUseCase:
         ping_stats = self._compute_speed_stats(pings)
 
         # Compute compliance
-        dl_threshold = self._get_config("download_threshold_mbps", 100.0)
-        ul_threshold = self._get_config("upload_threshold_mbps", 50.0)
-        tolerance = self._get_config("tolerance_percent", 15.0)
-
-        effective_dl = dl_threshold * (1 - tolerance / 100)
-        effective_ul = ul_threshold * (1 - tolerance / 100)
-
-        dl_violations = sum(1 for m in measurements if m.below_download_threshold)
-        ul_violations = sum(1 for m in measurements if m.below_upload_threshold)
-
+        dl_ok = total - dl_violations
+        ul_ok = total - ul_violations
         sla = SlaCompliance(
-            total_tests=len(measurements),
-            download_compliant=len(measurements) - dl_violations,
-            upload_compliant=len(measurements) - ul_violations,
-            download_compliance_pct=100 * (len(measurements) - dl_violations) / len(measurements),
-            upload_compliance_pct=100 * (len(measurements) - ul_violations) / len(measurements),
+            total_tests=total,
+            download_compliant=dl_ok,
+            upload_compliant=ul_ok,
+            download_compliance_pct=100 * dl_ok / total,
+            upload_compliance_pct=100 * ul_ok / total,
         )
 
         # Get total data usage
         total_data = await self._measurements.get_total_data_bytes()
 
         return GetStatisticsOutput(
-            total_tests=len(measurements),
+            total_tests=total,
             download=download_stats,
             upload=upload_stats,
             ping=ping_stats,
@@ -175,26 +279,32 @@ class GetStatisticsUseCase:
         )
 
     def _compute_speed_stats(self, values: list[float]) -> SpeedStatistics:
-        """Compute statistics for a list of values."""
+        """Compute statistics for a list of values.
+
+        Sorts once: min, max, median and the percentiles are all read from
+        the sorted list, and mean/stddev use float sums instead of the
+        exact (Fraction based) arithmetic of the statistics module.
+        """
         if not values:
             return SpeedStatistics()
 
         sorted_values = sorted(values)
         n = len(sorted_values)
+        avg = fsum(sorted_values) / n
+        stddev = (
+            sqrt(fsum((v - avg) ** 2 for v in sorted_values) / (n - 1)) if n > 1 else 0.0
+        )
+        p5, p25, p50, p75, p95 = (
+            self._percentile(sorted_values, p) for p in (5, 25, 50, 75, 95)
+        )
 
         return SpeedStatistics(
-            min=min(values),
-            max=max(values),
-            avg=mean(values),
-            median=median(values),
-            stddev=stdev(values) if n > 1 else 0.0,
-            percentiles=PercentileValues(
-                p5=self._percentile(sorted_values, 5),
-                p25=self._percentile(sorted_values, 25),
-                p50=self._percentile(sorted_values, 50),
-                p75=self._percentile(sorted_values, 75),
-                p95=self._percentile(sorted_values, 95),
-            ),
+            min=sorted_values[0],
+            max=sorted_values[-1],
+            avg=avg,
+            median=p50,  # linear interpolation at 50 is the median
+            stddev=stddev,
+            percentiles=PercentileValues(p5=p5, p25=p25, p50=p50, p75=p75, p95=p95),
         )
 
     def _percentile(self, sorted_values: list[float], p: int) -> float:
@@ -8,6 +8,8 @@ This use case orchestrates:
 4. Publishing relevant domain events
 5. Sending webhook notifications if configured
 """
+import asyncio
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Protocol
@@ -17,6 +19,10 @@ from gonzales.domain.value_objects import ThresholdConfig, ConnectionType
 from gonzales.domain.events import MeasurementCompleted, ThresholdViolation
 from gonzales.domain.exceptions import SpeedtestError, RateLimitError
 
+# Webhook deliveries still in flight; the event loop only keeps weak
+# references to tasks, so they are held here until they finish
+_webhook_tasks: set[asyncio.Task] = set()
+
 
 class SpeedtestPort(Protocol):
     """Protocol for speedtest execution."""
@@ -32,6 +38,7 @@ class MeasurementRepositoryPort(Protocol):
 class EventBusPort(Protocol):
     """Protocol for event publishing."""
     def publish(self, event_type: str, data: dict) -> None: ...
+    def post(self, event_type: str, data: dict) -> None: ...
 
 
 class WebhookPort(Protocol):
@@ -44,7 +51,7 @@ class ConfigPort(Protocol):
     def get(self, key: str, default=None): ...
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeedtestResult:
     """Result from speedtest execution."""
     download_bps: float
@@ -69,14 +76,14 @@ class SpeedtestResult:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class RunSpeedtestInput:
     """Input for running a speedtest."""
     server_id: Optional[int] = None
     triggered_by: str = "manual"  # "manual", "scheduled", "api"
 
 
-@dataclass
+@dataclass(slots=True)
 class RunSpeedtestOutput:
     """Output from running a speedtest."""
     measurement: MeasurementEntity
@@ -126,7 +133,7 @@ class RunSpeedtestUseCase:
             RateLimitError: If manual cooldown not elapsed
             SpeedtestError: If test execution fails
         """
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
 
         # Check cooldown for manual triggers
         if input_data.triggered_by == "manual" and self._config:
@@ -189,7 +196,7 @@ class RunSpeedtestUseCase:
         is_compliant = not (below_dl or below_ul)
         await self._publish_events(saved, is_compliant, dl_deficit, ul_deficit, threshold_config)
 
-        execution_time = (datetime.utcnow() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
 
         return RunSpeedtestOutput(
             measurement=saved,
@@ -230,7 +237,11 @@ class RunSpeedtestUseCase:
         ul_deficit: float,
         threshold_config: ThresholdConfig,
     ) -> None:
-        """Publish domain events and webhooks."""
+        """Publish domain events and webhooks.
+
+        Events are posted and the webhook is sent from a background task,
+        so neither subscribers nor webhook retries delay execute().
+        """
         # Measurement completed event
         completed_event = MeasurementCompleted(
             measurement_id=measurement.id or 0,
@@ -241,7 +252,7 @@ class RunSpeedtestUseCase:
             server_name=measurement.server_name,
             is_compliant=is_compliant,
         )
-        self._event_bus.publish("measurement_completed", completed_event.__dict__)
+        self._event_bus.post("measurement_completed", completed_event.__dict__)
 
         # Threshold violation event
         if not is_compliant:
@@ -256,13 +267,13 @@ class RunSpeedtestUseCase:
                 below_download=measurement.below_download_threshold,
                 below_upload=measurement.below_upload_threshold,
             )
-            self._event_bus.publish("threshold_violation", violation_event.__dict__)
+            self._event_bus.post("threshold_violation", violation_event.__dict__)
 
         # Send webhooks if configured
         if self._webhook and self._config:
             webhook_url = self._config.get("webhook_url", "")
             if webhook_url:
-                await self._webhook.send(
+                task = asyncio.create_task(self._webhook.send(
                     webhook_url,
                     "speedtest_complete",
                     {
@@ -272,4 +283,6 @@ class RunSpeedtestUseCase:
                         "ping_ms": round(measurement.ping_latency_ms, 2),
                         "is_compliant": is_compliant,
                     },
-                )
+                ))
+                _webhook_tasks.add(task)
+                task.add_done_callback(_webhook_tasks.discard)
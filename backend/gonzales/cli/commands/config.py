@@ -1,12 +1,33 @@
 """Config command."""
 
-from typing import Optional
+from collections.abc import Callable
+from typing import Any, Optional
 
 import typer
 
 from gonzales.cli.output import get_console, print_error, print_json, print_success
 from gonzales.config import MUTABLE_KEYS, settings
 
+# Marks a key that settings does not have
+_MISSING = object()
+_SORTED_MUTABLE_KEYS = tuple(sorted(MUTABLE_KEYS))
+
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in _TRUTHY
+
+
+# Parser and error message per type of the current value; exact type
+# lookup keeps bools (an int subclass) from being parsed as ints.
+# Values of any other type are stored as given.
+_CONVERTERS: dict[type, tuple[Callable[[str], Any], str]] = {
+    bool: (_parse_bool, ""),
+    int: (int, "is not a valid integer"),
+    float: (float, "is not a valid number"),
+}
+
 
 def config_cmd(
     key: Optional[str] = typer.Argument(
@@ -41,7 +62,7 @@ def config_cmd(
             print_json({"mutable_keys": list(MUTABLE_KEYS)})
         else:
             console.print("[bold]Configurable keys:[/bold]")
-            for k in sorted(MUTABLE_KEYS):
+            for k in _SORTED_MUTABLE_KEYS:
                 current = getattr(settings, k, None)
                 console.print(f"  {k}: [cyan]{current}[/cyan]")
         return
@@ -75,37 +96,30 @@ def config_cmd(
         return
 
     # Check if key exists
-    if not hasattr(settings, key):
+    current_value = getattr(settings, key, _MISSING)
+    if current_value is _MISSING:
         print_error(f"Unknown config key: {key}")
         raise typer.Exit(code=1)
 
     # Get/set specific key
     if key not in MUTABLE_KEYS and value is not None:
         print_error(f"'{key}' is not a mutable config key")
-        console.print(f"Mutable keys: {', '.join(sorted(MUTABLE_KEYS))}")
+        console.print(f"Mutable keys: {', '.join(_SORTED_MUTABLE_KEYS)}")
         raise typer.Exit(code=1)
 
     if value is not None:
         # Set value
-        current_value = getattr(settings, key)
-
         # Type conversion
-        if isinstance(current_value, bool):
-            typed_value = value.lower() in ("true", "1", "yes", "on")
-        elif isinstance(current_value, int):
-            try:
-                typed_value = int(value)
-            except ValueError:
-                print_error(f"'{value}' is not a valid integer")
-                raise typer.Exit(code=1)
-        elif isinstance(current_value, float):
+        converter = _CONVERTERS.get(type(current_value))
+        if converter is None:
+            typed_value = value
+        else:
+            parse, error = converter
             try:
-                typed_value = float(value)
+                typed_value = parse(value)
             except ValueError:
-                print_error(f"'{value}' is not a valid number")
+                print_error(f"'{value}' {error}")
                 raise typer.Exit(code=1)
-        else:
-            typed_value = value
 
         setattr(settings, key, typed_value)
         settings.save_config()
@@ -116,8 +130,6 @@ def config_cmd(
             print_success(f"Updated {key}: {current_value} -> {typed_value}")
     else:
         # Get value
-        current_value = getattr(settings, key)
-
         if json_output:
             print_json({key: current_value})
         else:
@@ -1,17 +1,81 @@
 """Export command."""
 
+import json
+import sys
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, TextIO
 
 import typer
 
 from gonzales.cli.output import get_console, print_error, print_success
 from gonzales.cli.utils import run_async
 from gonzales.db.engine import async_session, init_db
+from gonzales.db.models import Measurement
 from gonzales.db.repository import MeasurementRepository
-from gonzales.services.export_service import export_service
-from gonzales.services.statistics_service import statistics_service
+
+# Large write buffer so streamed exports hit the disk in big chunks
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Columns read by the CSV and JSON exports; rows expose them by name
+_EXPORT_COLUMNS = (
+    Measurement.id,
+    Measurement.timestamp,
+    Measurement.download_mbps,
+    Measurement.upload_mbps,
+    Measurement.ping_latency_ms,
+    Measurement.ping_jitter_ms,
+    Measurement.packet_loss_pct,
+    Measurement.isp,
+    Measurement.server_name,
+    Measurement.server_location,
+    Measurement.below_download_threshold,
+    Measurement.below_upload_threshold,
+)
+
+
+async def _rows(batches: AsyncIterator[list[Any]]) -> AsyncIterator[Any]:
+    """Flatten row batches."""
+    async for batch in batches:
+        for row in batch:
+            yield row
+
+
+def _json_record(m: Any) -> dict:
+    """Build the JSON export record for one measurement."""
+    return {
+        "id": m.id,
+        "timestamp": m.timestamp.isoformat(),
+        "download_mbps": round(m.download_mbps, 2),
+        "upload_mbps": round(m.upload_mbps, 2),
+        "ping_latency_ms": round(m.ping_latency_ms, 2),
+        "ping_jitter_ms": round(m.ping_jitter_ms, 2),
+        "server_name": m.server_name,
+        "server_location": m.server_location,
+        "isp": m.isp,
+    }
+
+
+async def _write_json(fh: TextIO, rows: AsyncIterator[Any], pretty: bool) -> None:
+    """Write measurements as a JSON array, one record at a time."""
+    if pretty:
+        # Same layout as json.dumps(records, indent=2)
+        separator = "[\n"
+        async for m in rows:
+            fh.write(separator)
+            fh.write("  " + json.dumps(_json_record(m), indent=2).replace("\n", "\n  "))
+            separator = ",\n"
+        fh.write("[]\n" if separator == "[\n" else "\n]\n")
+        return
+
+    separator = "["
+    async for m in rows:
+        fh.write(separator)
+        fh.write(json.dumps(_json_record(m), separators=(",", ":")))
+        separator = ","
+    fh.write("[]\n" if separator == "[" else "]\n")
 
 
 @run_async
@@ -39,6 +103,11 @@ async def export_cmd(
         "--pdf",
         help="Generate PDF report instead",
     ),
+    pretty: bool = typer.Option(
+        False,
+        "--pretty",
+        help="Indent JSON output",
+    ),
 ) -> None:
     """Export measurements to file."""
     await init_db()
@@ -51,14 +120,18 @@ async def export_cmd(
 
     async with async_session() as session:
         repo = MeasurementRepository(session)
-        measurements = await repo.get_all_in_range(start_date)
-
-        if not measurements:
-            print_error("No measurements to export")
-            raise typer.Exit(code=1)
 
         if pdf:
-            # PDF export
+            # Only the PDF path needs the statistics service
+            from gonzales.services.export_service import export_service
+            from gonzales.services.statistics_service import statistics_service
+
+            # The PDF layout needs every measurement at once
+            measurements = await repo.get_all_in_range(start_date)
+            if not measurements:
+                print_error("No measurements to export")
+                raise typer.Exit(code=1)
+
             stats = await statistics_service.get_statistics(session, start_date)
             stats_dict = {
                 "download": (
@@ -101,39 +174,45 @@ async def export_cmd(
             output.write_bytes(content)
             print_success(f"PDF report saved to: {output}")
 
-        elif format.lower() == "json":
-            import json
-
-            data = [
-                {
-                    "id": m.id,
-                    "timestamp": m.timestamp.isoformat(),
-                    "download_mbps": round(m.download_mbps, 2),
-                    "upload_mbps": round(m.upload_mbps, 2),
-                    "ping_latency_ms": round(m.ping_latency_ms, 2),
-                    "ping_jitter_ms": round(m.ping_jitter_ms, 2),
-                    "server_name": m.server_name,
-                    "server_location": m.server_location,
-                    "isp": m.isp,
-                }
-                for m in measurements
-            ]
-
-            json_content = json.dumps(data, indent=2)
-
-            if output:
-                output.write_text(json_content)
-                print_success(f"JSON exported to: {output}")
-            else:
-                print(json_content)
-
-        else:  # CSV
-            content = export_service.generate_csv(measurements)
-
-            if output:
-                output.write_text(content)
-                print_success(f"CSV exported to: {output}")
-            else:
-                print(content)
-
-        console.print(f"[dim]Exported {len(measurements)} measurements[/dim]")
+            console.print(f"[dim]Exported {len(measurements)} measurements[/dim]")
+            return
+
+        # CSV and JSON read plain column rows in batches, so neither the
+        # full result nor an ORM object per row is ever held in memory
+        batches = repo.iter_columns_in_range(_EXPORT_COLUMNS, start_date)
+        first_batch = await anext(batches, None)
+        if not first_batch:
+            print_error("No measurements to export")
+            raise typer.Exit(code=1)
+
+        exported = 0
+
+        async def counted_batches() -> AsyncIterator[list[Any]]:
+            nonlocal exported
+            batch = first_batch
+            while batch is not None:
+                exported += len(batch)
+                yield batch
+                batch = await anext(batches, None)
+
+        sink = (
+            output.open("w", buffering=_WRITE_BUFFER_SIZE)
+            if output
+            else nullcontext(sys.stdout)
+        )
+        with sink as fh:
+            if format.lower() == "json":
+                await _write_json(fh, _rows(counted_batches()), pretty)
+            else:  # CSV
+                # Loaded here so other CLI commands do not pay for it
+                from gonzales.services.export_service import export_service
+
+                fh.write(export_service.csv_header())
+                async for batch in counted_batches():
+                    export_service.write_csv_rows(fh, batch)
+
+        if output:
+            kind = "JSON" if format.lower() == "json" else "CSV"
+            print_success(f"{kind} exported to: {output}")
+
+        console.print(f"[dim]Exported {exported} measurements[/dim]")
@@ -79,7 +79,7 @@ async def history_cmd(
 
     if verbose:
         columns = ["ID", "Time", "Download", "Upload", "Ping", "Jitter", "Server"]
-        rows = [
+        rows = (
             [
                 m.id,
                 m.timestamp.strftime("%Y-%m-%d %H:%M"),
@@ -90,10 +90,10 @@ async def history_cmd(
                 m.server_name[:20] if m.server_name else "N/A",
             ]
             for m in measurements
-        ]
+        )
     else:
         columns = ["Time", "Download", "Upload", "Ping"]
-        rows = [
+        rows = (
             [
                 m.timestamp.strftime("%Y-%m-%d %H:%M"),
                 f"{m.download_mbps:.1f} Mbps",
@@ -101,7 +101,7 @@ async def history_cmd(
                 f"{m.ping_latency_ms:.1f} ms",
             ]
             for m in measurements
-        ]
+        )
 
     print_table(
         f"Speed Test History (showing {len(measurements)} of {total})",
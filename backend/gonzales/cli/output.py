@@ -2,6 +2,7 @@
 
 import json
 import sys
+from collections.abc import Iterable
 from typing import Any
 
 # Lazy import rich (only when not --json)
@@ -41,10 +42,13 @@ def print_json(data: Any) -> None:
 def print_table(
     title: str,
     columns: list[str],
-    rows: list[list[Any]],
+    rows: Iterable[list[Any]],
     use_json: bool = False,
 ) -> None:
-    """Print data as formatted table or JSON."""
+    """Print data as formatted table or JSON.
+
+    rows is consumed once, so a generator works.
+    """
     if use_json:
         data = [dict(zip(columns, row)) for row in rows]
         print_json({"title": title, "data": data})
@@ -35,6 +35,11 @@ class Settings(BaseSettings):
     debug: bool = False
 
     db_path: Path = Path("gonzales.db")
+    # Connection pool; the defaults match SQLAlchemy's and already cover the
+    # concurrent reads of the summary and status endpoints
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
     config_path: Path = Path("config.json")
     cors_origins: list[str] = ["http://localhost:5173", "http://localhost:8470"]
     speedtest_binary: str = "speedtest"
@@ -58,6 +63,16 @@ class Settings(BaseSettings):
     def database_url(self) -> str:
         return f"sqlite+aiosqlite:///{self.db_path}"
 
+    @property
+    def effective_download_threshold_mbps(self) -> float:
+        """Lowest download speed that still meets the threshold after tolerance."""
+        return self.download_threshold_mbps * (1 - self.tolerance_percent / 100)
+
+    @property
+    def effective_upload_threshold_mbps(self) -> float:
+        """Lowest upload speed that still meets the threshold after tolerance."""
+        return self.upload_threshold_mbps * (1 - self.tolerance_percent / 100)
+
     def load_config_overrides(self) -> None:
         if not self.config_path.exists():
             return
@@ -11,7 +11,7 @@ from starlette.requests import Request
 from gonzales.config import settings
 
 
-def _get_identifier(request: Request) -> str:
+def get_identifier(request: Request) -> str:
     """Get identifier for rate limiting.
 
     Uses X-Forwarded-For header when running behind a proxy (HA addon),
@@ -27,7 +27,7 @@ def _get_identifier(request: Request) -> str:
 
 # Create the limiter instance
 limiter = Limiter(
-    key_func=_get_identifier,
+    key_func=get_identifier,
     default_limits=["100/minute"],  # Default: 100 requests per minute
     storage_uri="memory://",  # In-memory storage (resets on restart)
     strategy="fixed-window",
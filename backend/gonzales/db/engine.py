@@ -1,7 +1,6 @@
 import logging
-from collections.abc import AsyncGenerator
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from gonzales.config import settings
@@ -13,8 +12,20 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     connect_args={"check_same_thread": False},
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _configure_connection(dbapi_connection, connection_record) -> None:
+    """Apply per-connection SQLite settings to every pooled connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -46,15 +57,9 @@ async def init_db() -> None:
         # Run migrations for existing tables
         await run_migrations(conn)
 
-        # SQLite optimizations
+        # WAL is stored in the database file; busy_timeout and cache_size are
+        # per connection and set in _configure_connection
         await conn.execute(text("PRAGMA journal_mode=WAL"))
-        await conn.execute(text("PRAGMA busy_timeout=5000"))
-        await conn.execute(text("PRAGMA cache_size=-65536"))
-
-
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as session:
-        yield session
 
 
 async def dispose_engine() -> None:
@@ -134,3 +134,8 @@ class Outage(Base):
     resolution_measurement_id: Mapped[int | None] = mapped_column(
         Integer, ForeignKey("measurements.id"), nullable=True
     )
+
+    @property
+    def is_active(self) -> bool:
+        """True while the outage has not been resolved."""
+        return self.ended_at is None
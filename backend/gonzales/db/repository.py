@@ -1,18 +1,42 @@
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 
-from sqlalchemy import Integer, asc, delete, desc, func, select
+from sqlalchemy import Integer, Row, asc, delete, desc, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from gonzales.db.models import Measurement, Outage, TestFailure
 
 
+def measurement_data_version() -> int:
+    """Return a counter that changes whenever measurements are added or deleted.
+
+    Bumped by every MeasurementRepository insert or delete in this process,
+    so callers can key caches of derived results on it. Writes from other
+    processes (e.g. the CLI) are not seen.
+    """
+    return MeasurementRepository._data_version
+
+
 class MeasurementRepository:
+    _data_version = 0
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @property
+    def data_version(self) -> int:
+        """See measurement_data_version()."""
+        return MeasurementRepository._data_version
+
+    @staticmethod
+    def _bump_data_version() -> None:
+        MeasurementRepository._data_version += 1
+
     async def create(self, measurement: Measurement) -> Measurement:
         self.session.add(measurement)
         await self.session.commit()
+        self._bump_data_version()
         await self.session.refresh(measurement)
         return measurement
 
@@ -76,16 +100,100 @@ class MeasurementRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_metric_rows(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        dl_threshold: float | None = None,
+        ul_threshold: float | None = None,
+    ) -> list[Row]:
+        """Speed, ping and threshold-flag columns for a date range.
+
+        Rows unpack as (download_mbps, upload_mbps, ping_latency_ms,
+        below_download_threshold, below_upload_threshold); no ORM objects
+        are built. When a threshold is given, its flag is computed in the
+        query against that threshold instead of read from the stored
+        column, so it follows the current settings.
+        """
+        below_download = (
+            Measurement.below_download_threshold
+            if dl_threshold is None
+            else (Measurement.download_mbps < dl_threshold).label("below_download_threshold")
+        )
+        below_upload = (
+            Measurement.below_upload_threshold
+            if ul_threshold is None
+            else (Measurement.upload_mbps < ul_threshold).label("below_upload_threshold")
+        )
+        query = select(
+            Measurement.download_mbps,
+            Measurement.upload_mbps,
+            Measurement.ping_latency_ms,
+            below_download,
+            below_upload,
+        )
+        if start_date:
+            query = query.where(Measurement.timestamp >= start_date)
+        if end_date:
+            query = query.where(Measurement.timestamp <= end_date)
+        result = await self.session.execute(query)
+        return list(result.all())
+
+    async def iter_in_range(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[Measurement]]:
+        """Stream measurements in a date range as batches, oldest first.
+
+        Rows are fetched through a server-side cursor, so only one batch
+        is held in memory at a time.
+        """
+        query = select(Measurement)
+        if start_date:
+            query = query.where(Measurement.timestamp >= start_date)
+        if end_date:
+            query = query.where(Measurement.timestamp <= end_date)
+        query = query.order_by(Measurement.timestamp)
+        result = await self.session.stream_scalars(query)
+        async for batch in result.partitions(batch_size):
+            yield list(batch)
+
+    async def iter_columns_in_range(
+        self,
+        columns: Sequence[InstrumentedAttribute],
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[Row]]:
+        """Stream selected measurement columns in a date range, oldest first.
+
+        Like iter_in_range, but yields plain rows (readable by attribute
+        name) instead of ORM objects.
+        """
+        query = select(*columns)
+        if start_date:
+            query = query.where(Measurement.timestamp >= start_date)
+        if end_date:
+            query = query.where(Measurement.timestamp <= end_date)
+        query = query.order_by(Measurement.timestamp)
+        result = await self.session.stream(query)
+        async for batch in result.partitions(batch_size):
+            yield list(batch)
+
     async def delete_by_id(self, measurement_id: int) -> bool:
         result = await self.session.execute(
             delete(Measurement).where(Measurement.id == measurement_id)
         )
         await self.session.commit()
+        self._bump_data_version()
         return result.rowcount > 0
 
     async def delete_all(self) -> int:
         result = await self.session.execute(delete(Measurement))
         await self.session.commit()
+        self._bump_data_version()
         return result.rowcount
 
     async def count(self) -> int:
@@ -105,6 +213,7 @@ class MeasurementRepository:
             delete(Measurement).where(Measurement.timestamp < cutoff_date)
         )
         await self.session.commit()
+        self._bump_data_version()
         return result.rowcount
 
     async def get_statistics(
@@ -140,6 +249,55 @@ class MeasurementRepository:
         row = result.one()
         return dict(row._mapping)
 
+    async def get_summary_snapshot(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict:
+        """Latest measurement plus window aggregates, in one statement.
+
+        Returns the latest measurement's timestamp and speeds (None when
+        there are no measurements) together with the window's averages, test
+        count, download violations and count of outages started in it.
+        """
+        outage_count = (
+            select(func.count(Outage.id))
+            .where(Outage.started_at >= start_date, Outage.started_at <= end_date)
+            .scalar_subquery()
+        )
+        window = (
+            select(
+                func.count(Measurement.id).label("total_tests"),
+                func.avg(Measurement.download_mbps).label("avg_download"),
+                func.avg(Measurement.upload_mbps).label("avg_upload"),
+                func.avg(Measurement.ping_latency_ms).label("avg_ping"),
+                func.sum(
+                    func.cast(Measurement.below_download_threshold, Integer)
+                ).label("download_violations"),
+                outage_count.label("outage_count"),
+            )
+            .where(Measurement.timestamp >= start_date, Measurement.timestamp <= end_date)
+            .subquery()
+        )
+        latest = (
+            select(
+                Measurement.timestamp.label("latest_timestamp"),
+                Measurement.download_mbps.label("latest_download"),
+                Measurement.upload_mbps.label("latest_upload"),
+                Measurement.ping_latency_ms.label("latest_ping"),
+            )
+            .order_by(desc(Measurement.timestamp))
+            .limit(1)
+            .subquery()
+        )
+        # The aggregate always yields one row; the outer join keeps it when
+        # the table is empty
+        query = select(window, latest).select_from(window.outerjoin(latest, true()))
+
+        result = await self.session.execute(query)
+        row = result.one()
+        return dict(row._mapping)
+
 
 class TestFailureRepository:
     def __init__(self, session: AsyncSession):
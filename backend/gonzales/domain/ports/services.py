@@ -162,6 +162,19 @@ class EventBusPort(ABC):
         """
         ...
 
+    def post(self, event_type: str, data: dict[str, Any]) -> None:
+        """
+        Queue an event without waiting for its subscribers.
+
+        Defaults to publish(); adapters that deliver from a background
+        task override it to return as soon as the event is queued.
+
+        Args:
+            event_type: Type identifier for the event
+            data: Event payload
+        """
+        self.publish(event_type, data)
+
     @abstractmethod
     def subscribe(self, event_type: str, handler: callable) -> None:  # type: ignore[type-arg]
         """
@@ -207,6 +220,15 @@ class ConfigPort(ABC):
         """Get all configuration as dict."""
         ...
 
+    def update(self, values: dict[str, Any]) -> None:
+        """Set several configuration values at once.
+
+        Defaults to one set() per key; adapters backed by storage can
+        override it to apply the batch in a single write.
+        """
+        for key, value in values.items():
+            self.set(key, value)
+
     @abstractmethod
     def save(self) -> None:
         """Persist configuration changes."""
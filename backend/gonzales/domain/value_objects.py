@@ -5,6 +5,7 @@ Value objects have no identity and are compared by their values.
 They encapsulate domain concepts and validation rules.
 """
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -315,6 +316,7 @@ class ConnectionType:
     value: str
 
     @classmethod
+    @lru_cache(maxsize=16)
     def detect(cls, interface_name: str, is_vpn: bool = False) -> "ConnectionType":
         """
         Detect connection type from interface name.
@@ -323,6 +325,9 @@ class ConnectionType:
         - eth*, enp*, eno* -> Ethernet
         - wlan*, wlp*, wl* -> WiFi
         - tun*, tap*, ppp* -> VPN
+
+        A host tests over the same few interfaces, so results are cached;
+        the value object is frozen, so sharing instances is safe.
         """
         if is_vpn:
             return cls(value=cls.VPN)
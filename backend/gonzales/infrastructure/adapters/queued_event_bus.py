@@ -0,0 +1,115 @@
+"""Event bus implementation that dispatches handlers off the caller's path."""
+import asyncio
+import inspect
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from gonzales.core.logging import logger
+from gonzales.domain.ports.services import EventBusPort
+
+# Pending events beyond this are dropped, oldest first
+DEFAULT_QUEUE_SIZE = 1024
+# How long shutdown waits for queued events to be delivered
+CLOSE_TIMEOUT_SECONDS = 5.0
+
+
+class QueuedEventBus(EventBusPort):
+    """Event bus that queues events and delivers them from a background task.
+
+    post() only enqueues, so publishers never wait for subscribers. The
+    handlers for one event run concurrently; they may be plain functions
+    or coroutine functions, and their exceptions are logged, not raised.
+
+    The queue and dispatcher belong to the loop of the first post() and
+    are replaced when a later post() runs on a different loop.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE) -> None:
+        self._handlers: dict[str, list[Callable[[dict[str, Any]], Any]]] = defaultdict(list)
+        self._maxsize = maxsize
+        self._queue: asyncio.Queue[tuple[str, dict[str, Any]]] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    def publish(self, event_type: str, data: dict[str, Any]) -> None:
+        """Publish an event; delivery is always queued, as with post()."""
+        self.post(event_type, data)
+
+    def post(self, event_type: str, data: dict[str, Any]) -> None:
+        """Queue an event for delivery and return immediately."""
+        queue = self._queue_for(asyncio.get_running_loop())
+        if queue.full():
+            dropped, _ = queue.get_nowait()
+            queue.task_done()
+            logger.warning("Event queue full, dropping oldest event: %s", dropped)
+        queue.put_nowait((event_type, data))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = self._loop.create_task(self._dispatch_loop(queue))
+
+    def subscribe(self, event_type: str, handler: Callable[[dict[str, Any]], Any]) -> None:
+        self._handlers[event_type].append(handler)
+
+    def unsubscribe(self, event_type: str, handler: Callable[[dict[str, Any]], Any]) -> None:
+        handlers = self._handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been delivered."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self, timeout: float = CLOSE_TIMEOUT_SECONDS) -> None:
+        """Deliver queued events for up to timeout seconds, then stop."""
+        if self._dispatcher is None or self._queue is None:
+            return
+        if self._loop is not asyncio.get_running_loop():
+            # The dispatcher's loop is gone, and its queue with it
+            self._queue = self._loop = self._dispatcher = None
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except TimeoutError:
+            logger.warning("Event bus closed with %d undelivered events", self._queue.qsize())
+        self._dispatcher.cancel()
+        try:
+            await self._dispatcher
+        except asyncio.CancelledError:
+            pass
+        self._dispatcher = None
+
+    def _queue_for(self, loop: asyncio.AbstractEventLoop) -> asyncio.Queue:
+        """Return the queue for loop, replacing one left from an earlier loop."""
+        if self._queue is None or self._loop is not loop:
+            if self._queue is not None and self._queue.qsize():
+                logger.warning(
+                    "Event loop changed, dropping %d undelivered events",
+                    self._queue.qsize(),
+                )
+            self._queue = asyncio.Queue(self._maxsize)
+            self._loop = loop
+            # A dispatcher from the old loop can never run again
+            self._dispatcher = None
+        return self._queue
+
+    async def _dispatch_loop(self, queue: asyncio.Queue) -> None:
+        while True:
+            event_type, data = await queue.get()
+            try:
+                handlers = list(self._handlers.get(event_type, ()))
+                results = await asyncio.gather(
+                    *(self._call(handler, data) for handler in handlers),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error("Event handler for %s failed: %s", event_type, result)
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    async def _call(handler: Callable[[dict[str, Any]], Any], data: dict[str, Any]) -> None:
+        result = handler(data)
+        if inspect.isawaitable(result):
+            await result
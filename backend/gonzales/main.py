@@ -6,10 +6,12 @@ from fastapi.staticfiles import StaticFiles
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from gonzales.api.router import api_router
+from gonzales.api.v1.config import flush_pending_save
 from gonzales.config import settings
 from gonzales.core.logging import logger
 from gonzales.core.security import configure_security
 from gonzales.db.engine import dispose_engine, init_db
+from gonzales.infrastructure.adapters.queued_event_bus import QueuedEventBus
 from gonzales.middleware.rate_limit import RateLimitMiddleware
 from gonzales.services.scheduler_service import scheduler_service
 from gonzales.services.smart_scheduler_service import smart_scheduler_service
@@ -65,10 +67,16 @@ async def lifespan(app: FastAPI):
 
     scheduler_service.start()
 
+    # Built here so its queue belongs to the server's event loop; use
+    # cases that publish domain events get it from app.state
+    app.state.domain_event_bus = QueuedEventBus()
+
     yield
 
     logger.info("Gonzales shutting down...")
     scheduler_service.stop()
+    await flush_pending_save()
+    await app.state.domain_event_bus.close()
     await dispose_engine()
 
 
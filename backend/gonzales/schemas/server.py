@@ -2,7 +2,7 @@ from pydantic import BaseModel
 
 
 class SpeedtestServer(BaseModel):
-    id: int
+    id: int = 0
     host: str = ""
     port: int = 0
     name: str = ""
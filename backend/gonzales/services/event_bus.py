@@ -1,31 +1,84 @@
 import asyncio
+import json
 from typing import Any, AsyncGenerator
 
 MAX_SUBSCRIBERS = 20
 SUBSCRIBE_TIMEOUT = 300  # 5 minutes max per SSE connection
 
 
+# Events that end a subscription; their SSE frames start with these prefixes
+_FINAL_EVENTS = ("complete", "error")
+_FINAL_FRAME_PREFIXES = tuple(f"event: {name}\n".encode() for name in _FINAL_EVENTS)
+
+
+def encode_frame(event: dict[str, Any]) -> bytes:
+    """Encode an event as an SSE frame."""
+    name = event.get("event", "message")
+    data = json.dumps(event.get("data", {}), default=str)
+    return f"event: {name}\ndata: {data}\n\n".encode()
+
+
+def is_final_frame(frame: bytes) -> bool:
+    """Return whether an SSE frame ends the stream (complete or error)."""
+    return frame.startswith(_FINAL_FRAME_PREFIXES)
+
+
 class EventBus:
     def __init__(self) -> None:
-        self._subscribers: list[asyncio.Queue[dict[str, Any]]] = []
+        self._subscribers: set[asyncio.Queue[dict[str, Any]]] = set()
         self._last_event: dict[str, Any] | None = None
+        # SSE streams receive pre-encoded frames instead of event dicts
+        self._frame_subscribers: set[asyncio.Queue[bytes]] = set()
+        # Encoded form of _last_event, filled on first use after each publish
+        self._last_frame: bytes | None = None
 
     @property
     def subscriber_count(self) -> int:
-        return len(self._subscribers)
+        return len(self._subscribers) + len(self._frame_subscribers)
+
+    @property
+    def last_frame(self) -> bytes | None:
+        """SSE frame of the buffered latest event, encoded at most once."""
+        if self._last_frame is None and self._last_event is not None:
+            self._last_frame = encode_frame(self._last_event)
+        return self._last_frame
 
     def publish(self, event: dict[str, Any]) -> None:
         # Buffer the latest event so late subscribers can catch up
-        if event.get("event") in ("complete", "error"):
+        if event.get("event") in _FINAL_EVENTS:
             self._last_event = None
         else:
             self._last_event = event
+        self._last_frame = None
 
         for queue in self._subscribers:
             queue.put_nowait(event)
 
+        if self._frame_subscribers:
+            # Encode once, then hand the same bytes to every SSE stream
+            frame = encode_frame(event)
+            if self._last_event is not None:
+                self._last_frame = frame
+            for frame_queue in self._frame_subscribers:
+                frame_queue.put_nowait(frame)
+
+    def add_frame_subscriber(self) -> asyncio.Queue[bytes] | None:
+        """Register an SSE stream; returns None when the subscriber limit is hit.
+
+        The queue only receives events published from now on; streams replay
+        last_frame themselves before reading it.
+        """
+        if self.subscriber_count >= MAX_SUBSCRIBERS:
+            return None
+        queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._frame_subscribers.add(queue)
+        return queue
+
+    def remove_frame_subscriber(self, queue: asyncio.Queue[bytes]) -> None:
+        self._frame_subscribers.discard(queue)
+
     async def subscribe(self) -> AsyncGenerator[dict[str, Any], None]:
-        if len(self._subscribers) >= MAX_SUBSCRIBERS:
+        if self.subscriber_count >= MAX_SUBSCRIBERS:
             yield {"event": "error", "data": {"message": "Too many connections"}}
             return
 
@@ -35,20 +88,19 @@ class EventBus:
         if self._last_event is not None:
             queue.put_nowait(self._last_event)
 
-        self._subscribers.append(queue)
+        self._subscribers.add(queue)
         try:
             while True:
                 event = await asyncio.wait_for(
                     queue.get(), timeout=SUBSCRIBE_TIMEOUT
                 )
                 yield event
-                if event.get("event") in ("complete", "error"):
+                if event.get("event") in _FINAL_EVENTS:
                     break
         except asyncio.TimeoutError:
             yield {"event": "error", "data": {"message": "Connection timeout"}}
         finally:
-            if queue in self._subscribers:
-                self._subscribers.remove(queue)
+            self._subscribers.discard(queue)
 
 
 event_bus = EventBus()
@@ -1,21 +1,9 @@
 import csv
 import hashlib
 import io
+from collections.abc import Iterable
 from datetime import datetime
-
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import mm
-from reportlab.platypus import (
-    KeepTogether,
-    PageBreak,
-    Paragraph,
-    SimpleDocTemplate,
-    Spacer,
-    Table,
-    TableStyle,
-)
+from typing import TextIO
 
 from gonzales.config import settings
 from gonzales.db.models import Measurement
@@ -38,7 +26,8 @@ class ExportService:
         "below_upload_threshold",
     ]
 
-    def generate_csv(self, measurements: list[Measurement]) -> str:
+    def csv_header(self) -> str:
+        """Return the branding/threshold preamble and the column header row."""
         output = io.StringIO()
         # Gonzales branding header
         output.write("# Gonzales Speed Test Export\n")
@@ -55,10 +44,19 @@ class ExportService:
         output.write(f"# Effective Min Download: {eff_dl:.0f} Mbps\n")
         output.write(f"# Effective Min Upload: {eff_ul:.0f} Mbps\n")
         output.write("#\n")
-        writer = csv.writer(output)
-        writer.writerow(self.CSV_COLUMNS)
-        for m in measurements:
-            writer.writerow([
+        csv.writer(output).writerow(self.CSV_COLUMNS)
+        return output.getvalue()
+
+    def csv_rows(self, measurements: Iterable[Measurement]) -> str:
+        """Format measurements as CSV data rows (no header)."""
+        output = io.StringIO()
+        self.write_csv_rows(output, measurements)
+        return output.getvalue()
+
+    def write_csv_rows(self, fh: TextIO, measurements: Iterable[Measurement]) -> None:
+        """Write measurements as CSV data rows (no header) to a text stream."""
+        csv.writer(fh).writerows(
+            [
                 m.id,
                 m.timestamp.isoformat(),
                 round(m.download_mbps, 2),
@@ -71,8 +69,12 @@ class ExportService:
                 m.server_location,
                 m.below_download_threshold,
                 m.below_upload_threshold,
-            ])
-        return output.getvalue()
+            ]
+            for m in measurements
+        )
+
+    def generate_csv(self, measurements: list[Measurement]) -> str:
+        return self.csv_header() + self.csv_rows(measurements)
 
     def generate_pdf(
         self,
@@ -81,6 +83,14 @@ class ExportService:
         start_date: datetime | None = None,
         end_date: datetime | None = None,
     ) -> bytes:
+        # reportlab is heavy to import and only needed for PDF export, so it
+        # is loaded on first use rather than when the API routers are built.
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+        from reportlab.lib.units import mm
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(
             buffer,
@@ -251,6 +261,20 @@ class ExportService:
         end_date: datetime | None = None,
     ) -> bytes:
         """Generate a professional compliance report with detailed analysis."""
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+        from reportlab.lib.units import mm
+        from reportlab.platypus import (
+            KeepTogether,
+            PageBreak,
+            Paragraph,
+            SimpleDocTemplate,
+            Spacer,
+            Table,
+            TableStyle,
+        )
+
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(
             buffer,
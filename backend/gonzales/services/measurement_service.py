@@ -18,13 +18,21 @@ from gonzales.core.exceptions import CooldownError, TestInProgressError
 from gonzales.domain.value_objects import ThresholdConfig
 from gonzales.core.logging import logger
 from gonzales.db.models import Measurement, TestFailure
-from gonzales.db.repository import MeasurementRepository, TestFailureRepository
+from gonzales.db.repository import (
+    MeasurementRepository,
+    TestFailureRepository,
+    measurement_data_version,
+)
+from gonzales.schemas.measurement import MeasurementOut
 from gonzales.schemas.speedtest_raw import SpeedtestRawResult
 from gonzales.services.event_bus import event_bus
 from gonzales.services.speedtest_runner import speedtest_runner
 from gonzales.services.webhook_service import webhook_service
 from gonzales.utils.connection_detector import detect_connection_type
 
+# How long the serialized latest measurement is reused for dashboard polls
+LATEST_CACHE_TTL_SECONDS = 1.0
+
 
 class MeasurementService:
     """Service for running and managing speed test measurements.
@@ -44,6 +52,8 @@ class MeasurementService:
         self._lock = asyncio.Lock()
         self._test_in_progress = False
         self._last_manual_trigger: float = 0.0
+        # (monotonic time of lookup, latest measurement) for get_latest_out
+        self._latest_cache: tuple[float, MeasurementOut | None] | None = None
 
     @property
     def test_in_progress(self) -> bool:
@@ -56,10 +66,13 @@ class MeasurementService:
         This is used by the async trigger endpoint to immediately flag
         that a test is starting, before the background task begins.
 
+        The flag alone is checked: run_test sets it as soon as it holds the
+        lock, with no await in between, so a held lock implies the flag.
+
         Returns:
             True if marked successfully, False if test already in progress.
         """
-        if self._test_in_progress or self._lock.locked():
+        if self._test_in_progress:
             return False
         self._test_in_progress = True
         return True
@@ -163,16 +176,16 @@ class MeasurementService:
                 measurement = self._create_measurement_from_result(raw_result, raw_json)
                 repo = MeasurementRepository(session)
                 saved = await repo.create(measurement)
+                self.invalidate_latest()
 
                 if saved.below_download_threshold or saved.below_upload_threshold:
-                    tolerance_factor = 1 - (settings.tolerance_percent / 100)
                     logger.warning(
                         "Threshold violation: DL=%.1f Mbps (min %.1f), "
                         "UL=%.1f Mbps (min %.1f) [tolerance %.0f%%]",
                         saved.download_mbps,
-                        settings.download_threshold_mbps * tolerance_factor,
+                        settings.effective_download_threshold_mbps,
                         saved.upload_mbps,
-                        settings.upload_threshold_mbps * tolerance_factor,
+                        settings.effective_upload_threshold_mbps,
                         settings.tolerance_percent,
                     )
 
@@ -268,6 +281,41 @@ class MeasurementService:
         repo = MeasurementRepository(session)
         return await repo.get_latest()
 
+    async def get_latest_out(self, session: AsyncSession) -> MeasurementOut | None:
+        """Get the most recent measurement as a response schema, briefly cached.
+
+        Dashboards poll the latest result, so the serialized value is reused
+        for LATEST_CACHE_TTL_SECONDS. Inserts and deletes made through this
+        service drop the cached value immediately.
+
+        Args:
+            session: Database session.
+
+        Returns:
+            The latest measurement or None if no measurements exist.
+        """
+        now = time.monotonic()
+        cached = self._latest_cache
+        if cached is not None and now - cached[0] < LATEST_CACHE_TTL_SECONDS:
+            return cached[1]
+        m = await self.get_latest(session)
+        latest = MeasurementOut.model_validate(m) if m is not None else None
+        self._latest_cache = (now, latest)
+        return latest
+
+    @property
+    def data_version(self) -> int:
+        """Counter that changes whenever measurements are added or deleted.
+
+        Lets callers key caches of derived results on the measurement data;
+        see measurement_data_version().
+        """
+        return measurement_data_version()
+
+    def invalidate_latest(self) -> None:
+        """Drop the cached latest measurement."""
+        self._latest_cache = None
+
     async def get_by_id(self, session: AsyncSession, measurement_id: int) -> Measurement | None:
         """Get a measurement by its ID.
 
@@ -292,7 +340,9 @@ class MeasurementService:
             True if deleted, False if not found.
         """
         repo = MeasurementRepository(session)
-        return await repo.delete_by_id(measurement_id)
+        deleted = await repo.delete_by_id(measurement_id)
+        self.invalidate_latest()
+        return deleted
 
     async def delete_all(self, session: AsyncSession) -> int:
         """Delete all measurements.
@@ -304,7 +354,9 @@ class MeasurementService:
             Number of deleted measurements.
         """
         repo = MeasurementRepository(session)
-        return await repo.delete_all()
+        count = await repo.delete_all()
+        self.invalidate_latest()
+        return count
 
     async def count(self, session: AsyncSession) -> int:
         """Get total count of measurements.
@@ -3,6 +3,7 @@
 import math
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 
 from gonzales.utils.math_utils import coefficient_of_variation, pearson_correlation
 
@@ -21,6 +22,10 @@ from gonzales.schemas.root_cause import (
     TimePattern,
 )
 
+# Threshold flags are bools, so summing them counts violations in C
+_below_download = attrgetter("below_download_threshold")
+_below_upload = attrgetter("below_upload_threshold")
+
 
 class RootCauseService:
     """Correlates data from multiple sources for root-cause analysis.
@@ -441,8 +446,8 @@ class RootCauseService:
             evidence.append(f"Speed below threshold in {len(violations)}/{len(measurements)} tests ({violation_rate*100:.1f}%)")
 
             # Check for consistent patterns
-            download_violations = sum(1 for m in violations if m.below_download_threshold)
-            upload_violations = sum(1 for m in violations if m.below_upload_threshold)
+            download_violations = sum(map(_below_download, violations))
+            upload_violations = sum(map(_below_upload, violations))
 
             if download_violations > upload_violations * 2:
                 evidence.append("Download speed more affected than upload")
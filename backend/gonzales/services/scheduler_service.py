@@ -1,4 +1,5 @@
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -36,6 +37,17 @@ def _calculate_jitter(interval_minutes: int) -> int:
     return int(jitter_minutes * 60)
 
 
+@dataclass(slots=True, frozen=True)
+class SchedulerSnapshot:
+    """Point-in-time view of the scheduler state."""
+
+    running: bool
+    enabled: bool
+    paused: bool
+    next_run_time: datetime | None  # only set while enabled
+    test_in_progress: bool
+
+
 class SchedulerService:
     def __init__(self) -> None:
         self._scheduler: AsyncIOScheduler | None = None
@@ -81,6 +93,21 @@ class SchedulerService:
             return jobs[0].next_run_time
         return None
 
+    def snapshot(self) -> SchedulerSnapshot:
+        """Return the scheduler state in one consistent read.
+
+        The next run time is only looked up when the scheduler is enabled.
+        """
+        running = self.running
+        enabled = running and not self._paused
+        return SchedulerSnapshot(
+            running=running,
+            enabled=enabled,
+            paused=self._paused,
+            next_run_time=self.next_run_time if enabled else None,
+            test_in_progress=self._test_in_progress,
+        )
+
     @property
     def outage_status(self) -> dict:
         """Return current outage status for API exposure."""
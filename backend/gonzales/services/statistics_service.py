@@ -1034,7 +1034,6 @@ class StatisticsService:
             for m in measurements
         )
 
-        tolerance_factor = 1 - (settings.tolerance_percent / 100)
         return StatisticsOut(
             total_tests=agg["total_tests"] or 0,
             download=_compute_speed_stats(download_values),
@@ -1045,8 +1044,8 @@ class StatisticsService:
             download_threshold_mbps=settings.download_threshold_mbps,
             upload_threshold_mbps=settings.upload_threshold_mbps,
             tolerance_percent=settings.tolerance_percent,
-            effective_download_threshold_mbps=round(settings.download_threshold_mbps * tolerance_factor, 1),
-            effective_upload_threshold_mbps=round(settings.upload_threshold_mbps * tolerance_factor, 1),
+            effective_download_threshold_mbps=round(settings.effective_download_threshold_mbps, 1),
+            effective_upload_threshold_mbps=round(settings.effective_upload_threshold_mbps, 1),
             total_data_used_bytes=total_data_bytes,
         )
 
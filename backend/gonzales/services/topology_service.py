@@ -1,7 +1,8 @@
 """Network topology analysis service."""
 from datetime import datetime, timezone
+from operator import attrgetter
 
-from sqlalchemy import delete, desc, select
+from sqlalchemy import Row, delete, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -120,6 +121,26 @@ class TopologyService:
         )
         return list(result.scalars().all())
 
+    async def get_history_entries(
+        self,
+        session: AsyncSession,
+        limit: int = 10,
+    ) -> list[Row]:
+        """Get the summary columns of recent topology analyses, without hops."""
+        result = await session.execute(
+            select(
+                NetworkTopology.id,
+                NetworkTopology.timestamp,
+                NetworkTopology.target_host,
+                NetworkTopology.total_hops,
+                NetworkTopology.total_latency_ms,
+                NetworkTopology.local_network_ok,
+            )
+            .order_by(desc(NetworkTopology.timestamp))
+            .limit(limit)
+        )
+        return list(result.all())
+
     async def get_diagnosis(self, session: AsyncSession, limit: int = 10) -> dict:
         """Get aggregated network diagnosis based on recent analyses."""
         analyses = await self.get_history(session, limit)
@@ -146,18 +167,19 @@ class TopologyService:
         # Find common bottleneck hops (hops with high latency)
         bottleneck_counts: dict[int, int] = {}
         for analysis in analyses:
-            if analysis.hops:
-                # Find hop with max latency
-                valid_hops = [h for h in analysis.hops if h.latency_ms is not None]
-                if valid_hops:
-                    max_hop = max(valid_hops, key=lambda h: h.latency_ms or 0)
-                    if max_hop.latency_ms and max_hop.latency_ms > 20:
-                        hop_num = max_hop.hop_number
-                        bottleneck_counts[hop_num] = bottleneck_counts.get(hop_num, 0) + 1
+            # Find hop with max latency
+            max_hop = max(
+                (h for h in analysis.hops if h.latency_ms is not None),
+                key=attrgetter("latency_ms"),
+                default=None,
+            )
+            if max_hop is not None and max_hop.latency_ms > 20:
+                hop_num = max_hop.hop_number
+                bottleneck_counts[hop_num] = bottleneck_counts.get(hop_num, 0) + 1
 
         common_bottlenecks = sorted(
             bottleneck_counts.keys(),
-            key=lambda h: bottleneck_counts[h],
+            key=bottleneck_counts.__getitem__,
             reverse=True,
         )[:3]
 
@@ -23,6 +23,9 @@ async def setup_db():
     yield
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    # Each test runs on its own event loop; drop the pooled connection so its
+    # asyncio locks are not reused from a loop that has since closed
+    await engine.dispose()
 
 
 @pytest.fixture
@@ -83,7 +86,10 @@ async def app(session):
 
     from gonzales.api.dependencies import get_db
     from gonzales.api.router import api_router
+    from gonzales.api.v1 import status as status_api
+    from gonzales.api.v1 import summary as summary_api
     from gonzales.core.security import configure_security
+    from gonzales.services.measurement_service import measurement_service
 
     test_app = FastAPI()
     configure_security(test_app)
@@ -94,6 +100,11 @@ async def app(session):
             yield s
 
     test_app.dependency_overrides[get_db] = override_get_db
+    # Seeded rows bypass the service and repository, so never serve a
+    # previous test's value
+    measurement_service.invalidate_latest()
+    status_api._status_cache = None
+    summary_api._summary_cache = None
     return test_app
 
 
@@ -1,14 +1,33 @@
 """Tests for the REST API endpoints."""
 
+import asyncio
+import hashlib
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
-from gonzales.db.models import Measurement
-from gonzales.db.repository import MeasurementRepository
+import pytest
+
+from gonzales.api.dependencies import require_api_key, verify_api_key
+from gonzales.db.models import Measurement, NetworkHop, NetworkTopology, Outage
+from gonzales.db.repository import MeasurementRepository, OutageRepository
 
 from .conftest import TestSessionLocal
 
 
+@contextmanager
+def _api_key(key: str):
+    """Configure an API key; the expected digest is fixed at import, so patch it too."""
+    digest = hashlib.sha256(key.encode()).digest() if key else None
+    with (
+        patch("gonzales.api.dependencies.settings") as mock_settings,
+        patch("gonzales.api.dependencies._EXPECTED_DIGEST", digest),
+    ):
+        mock_settings.api_key = key
+        mock_settings.ha_addon = False
+        yield mock_settings
+
+
 async def _seed_measurements(count: int = 5, base_dl: float = 500.0):
     """Insert test measurements into the DB."""
     base = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
@@ -144,20 +163,354 @@ class TestStatusAPI:
         assert "uptime_seconds" in data
         assert "total_measurements" in data
         assert data["total_measurements"] == 0
+        assert data["total_failures"] == 0
+        assert data["last_test_time"] is None
+
+    async def test_status_with_data(self, client):
+        await _seed_measurements(3)
+        resp = await client.get("/api/v1/status")
+        data = resp.json()
+        assert data["total_measurements"] == 3
+        assert data["last_test_time"].startswith("2025-06-01T14:00:00")
+
+    async def test_concurrent_polls_share_one_build(self, client, monkeypatch):
+        from gonzales.api.v1 import status as status_api
+
+        builds = 0
+        build_status = status_api._build_status
+
+        async def counting_build(session):
+            nonlocal builds
+            builds += 1
+            await asyncio.sleep(0.01)
+            return await build_status(session)
+
+        monkeypatch.setattr(status_api, "_build_status", counting_build)
+        responses = await asyncio.gather(
+            *(client.get("/api/v1/status") for _ in range(5))
+        )
+        assert all(r.status_code == 200 for r in responses)
+        assert builds == 1
+
+        # Fresh results are served from the cache without another build
+        await client.get("/api/v1/status")
+        assert builds == 1
+
+    def test_db_size_cached(self, tmp_path, monkeypatch):
+        from gonzales.api.v1 import status as status_api
+        from gonzales.config import settings
+
+        db_file = tmp_path / "gonzales.db"
+        monkeypatch.setattr(settings, "db_path", db_file)
+        monkeypatch.setattr(status_api, "_db_size_cache", None)
+        assert status_api._db_size() == 0
+
+        db_file.write_bytes(b"x" * 10)
+        assert status_api._db_size() == 0  # still within the TTL
+        monkeypatch.setattr(status_api, "_db_size_cache", None)
+        assert status_api._db_size() == 10
+
+
+class TestOutagesAPI:
+    async def test_list_outages(self, client):
+        start = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+        async with TestSessionLocal() as session:
+            repo = OutageRepository(session)
+            await repo.create(Outage(
+                started_at=start,
+                ended_at=start + timedelta(minutes=5),
+                duration_seconds=300.0,
+                failure_count=3,
+                trigger_error="timeout",
+            ))
+            await repo.create(Outage(
+                started_at=start + timedelta(hours=1), failure_count=3, trigger_error="dns",
+            ))
+        resp = await client.get("/api/v1/outages")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 2
+        by_error = {o["trigger_error"]: o for o in data["items"]}
+        assert by_error["timeout"]["is_active"] is False
+        assert by_error["timeout"]["duration_seconds"] == 300.0
+        assert by_error["dns"]["is_active"] is True
+
+
+class TestQosAPI:
+    async def test_profiles(self, client):
+        from gonzales.services.qos_service import qos_service
+
+        resp = await client.get("/api/v1/qos/profiles")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        expected = [p.model_dump() for p in qos_service.get_all_profiles()]
+        assert resp.json() == expected
+        # Served from the cached encoding on repeat requests
+        assert (await client.get("/api/v1/qos/profiles")).json() == expected
+
+
+class TestServersAPI:
+    async def test_list_servers(self, client):
+        raw = [
+            {"id": 1, "host": "a.example:8080", "port": 8080, "name": "A",
+             "location": "Berlin", "country": "Germany", "extra": "ignored"},
+            {"id": 2, "name": "B"},
+        ]
+        with patch(
+            "gonzales.api.v1.servers.speedtest_runner.list_servers", return_value=raw
+        ):
+            resp = await client.get("/api/v1/servers")
+        assert resp.status_code == 200
+        servers = resp.json()["servers"]
+        assert servers[0]["location"] == "Berlin"
+        assert "extra" not in servers[0]
+        assert servers[1] == {
+            "id": 2, "host": "", "port": 0, "name": "B", "location": "", "country": "",
+        }
+
+
+class TestSpeedtestAPI:
+    @pytest.fixture(autouse=True)
+    def _fresh_buckets(self, monkeypatch):
+        from gonzales.api.v1 import speedtest as speedtest_api
+
+        monkeypatch.setattr(speedtest_api, "_trigger_buckets", {})
+
+    async def test_trigger_busy(self, client):
+        with patch(
+            "gonzales.api.v1.speedtest.measurement_service.mark_test_starting",
+            return_value=False,
+        ):
+            resp = await client.post("/api/v1/speedtest/trigger")
+        assert resp.status_code == 503
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == {"detail": "A speed test is already in progress"}
+
+    async def test_trigger_rate_limited(self, client):
+        from gonzales.api.v1.speedtest import _TRIGGER_PER_MINUTE
+
+        with patch(
+            "gonzales.api.v1.speedtest.measurement_service.mark_test_starting",
+            return_value=False,
+        ):
+            for _ in range(_TRIGGER_PER_MINUTE):
+                resp = await client.post("/api/v1/speedtest/trigger")
+                assert resp.status_code == 503
+            resp = await client.post("/api/v1/speedtest/trigger")
+        assert resp.status_code == 429
+        assert "Rate limit exceeded" in resp.json()["error"]
+        assert int(resp.headers["Retry-After"]) > 0
+
+    def test_trigger_buckets_are_capped(self):
+        from gonzales.api.v1 import speedtest as speedtest_api
+
+        for i in range(speedtest_api._MAX_TRIGGER_BUCKETS + 10):
+            speedtest_api._trigger_bucket(f"client-{i}")
+        assert len(speedtest_api._trigger_buckets) == speedtest_api._MAX_TRIGGER_BUCKETS
+        assert "client-0" not in speedtest_api._trigger_buckets
+        assert f"client-{speedtest_api._MAX_TRIGGER_BUCKETS + 9}" in speedtest_api._trigger_buckets
+
+
+class TestSummaryAPI:
+    async def test_summary_empty(self, client):
+        resp = await client.get("/api/v1/summary")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "unknown"
+        assert data["latest_test"] is None
+        assert data["statistics_7d"] is None
+
+    async def test_summary_with_recent_data(self, client, make_measurement):
+        async with TestSessionLocal() as session:
+            session.add_all([
+                make_measurement(download_mbps=900.0, upload_mbps=400.0),
+                make_measurement(
+                    download_mbps=100.0,
+                    upload_mbps=50.0,
+                    timestamp=datetime.now(timezone.utc) - timedelta(days=1),
+                    below_download_threshold=True,
+                ),
+            ])
+            await session.commit()
+
+        resp = await client.get("/api/v1/summary")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["latest_test"]["download_mbps"] == 900.0
+        assert data["statistics_7d"]["test_count"] == 2
+        assert data["statistics_7d"]["avg_download"] == 500.0
+        assert data["statistics_7d"]["reliability_percent"] == 50.0
+
+        resp = await client.get("/api/v1/summary?format=markdown")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/markdown")
+        assert "**7-Day Statistics:**" in resp.text
+
+    async def test_summary_cached_until_data_changes(self, client, monkeypatch):
+        from gonzales.api.v1 import summary as summary_api
+
+        builds = 0
+        build_summary = summary_api._build_summary
+
+        async def counting_build(*args):
+            nonlocal builds
+            builds += 1
+            return await build_summary(*args)
+
+        monkeypatch.setattr(summary_api, "_build_summary", counting_build)
+        first = (await client.get("/api/v1/summary")).json()
+        markdown = (await client.get("/api/v1/summary?format=markdown")).text
+        assert (await client.get("/api/v1/summary")).json() == first
+        assert builds == 1
+        assert markdown.startswith("## Internet Status: Unknown")
+
+        await _seed_measurements(1)  # as after a new test result
+        await client.get("/api/v1/summary")
+        assert builds == 2
+
+        # Retention cleanup deletes through the repository as well
+        async with TestSessionLocal() as session:
+            await MeasurementRepository(session).delete_older_than(datetime.now(timezone.utc))
+        await client.get("/api/v1/summary")
+        assert builds == 3
+
+
+class TestTopologyAPI:
+    async def _seed_topology(self) -> int:
+        async with TestSessionLocal() as session:
+            topology = NetworkTopology(
+                timestamp=datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc),
+                target_host="1.1.1.1",
+                total_hops=3,
+                total_latency_ms=35.0,
+                local_network_ok=True,
+                diagnosis="ok",
+            )
+            # Stored out of order to exercise sorting by hop number
+            topology.hops = [
+                NetworkHop(hop_number=3, ip_address="1.1.1.1", latency_ms=35.0),
+                NetworkHop(hop_number=1, ip_address="192.168.1.1", latency_ms=1.0, is_local=True),
+                NetworkHop(hop_number=2, is_timeout=True),
+            ]
+            session.add(topology)
+            await session.commit()
+            return topology.id
+
+    async def test_history(self, client):
+        topology_id = await self._seed_topology()
+        resp = await client.get("/api/v1/topology/history")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 1
+        assert data["entries"][0]["id"] == topology_id
+        assert data["entries"][0]["target_host"] == "1.1.1.1"
+        assert data["entries"][0]["total_hops"] == 3
+
+    async def test_get_by_id(self, client):
+        topology_id = await self._seed_topology()
+        resp = await client.get(f"/api/v1/topology/{topology_id}")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [h["hop_number"] for h in data["hops"]] == [1, 2, 3]
+        assert [h["status"] for h in data["hops"]] == ["ok", "timeout", "ok"]
+        assert data["bottleneck_hop"] == 3
+
+    async def test_diagnosis_counts_bottlenecks(self, client):
+        await self._seed_topology()
+        await self._seed_topology()
+        resp = await client.get("/api/v1/topology/diagnosis")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total_analyses"] == 2
+        assert data["common_bottleneck_hops"] == [3]
+
+    def test_hop_status_matches_schema_rules(self):
+        from itertools import product
+        from types import SimpleNamespace
+
+        from gonzales.api.v1.topology import _get_hop_status
+        from gonzales.schemas.topology import NetworkHopOut
+
+        for timeout, loss, latency in product(
+            (False, True), (0.0, 5.0, 5.1), (None, 50.0, 50.1)
+        ):
+            hop = SimpleNamespace(is_timeout=timeout, packet_loss_pct=loss, latency_ms=latency)
+            assert _get_hop_status(hop) == NetworkHopOut.get_status(latency, loss, timeout)
+
+
+class TestConfigAPI:
+    async def test_get_reflects_update(self, client, monkeypatch):
+        from gonzales.api.v1 import config as config_api
+        from gonzales.config import Settings, settings
+
+        monkeypatch.setattr(config_api, "_config_cache", None)
+        monkeypatch.setattr(settings, "isp_name", settings.isp_name)
+        monkeypatch.setattr(Settings, "save_config", lambda self: None)
+
+        before = (await client.get("/api/v1/config")).json()
+        resp = await client.put("/api/v1/config", json={"isp_name": "Cached ISP"})
+        assert resp.status_code == 200
+        assert resp.json()["isp_name"] == "Cached ISP"
+
+        after = (await client.get("/api/v1/config")).json()
+        assert after["isp_name"] == "Cached ISP"
+        assert after["theme"] == before["theme"]
+        await config_api.flush_pending_save()
+
+    async def test_updates_are_saved_once(self, client, monkeypatch):
+        from gonzales.api.v1 import config as config_api
+        from gonzales.config import Settings, settings
+
+        saves = []
+        monkeypatch.setattr(settings, "isp_name", settings.isp_name)
+        monkeypatch.setattr(Settings, "save_config", lambda self: saves.append(self.isp_name))
+        monkeypatch.setattr(config_api, "_config_cache", None)
+        monkeypatch.setattr(config_api, "_SAVE_DELAY_SECONDS", 0.01)
+
+        for name in ("First ISP", "Second ISP"):
+            resp = await client.put("/api/v1/config", json={"isp_name": name})
+            assert resp.status_code == 200
+        assert saves == []
+
+        await asyncio.sleep(0.05)
+        assert saves == ["Second ISP"]
+
+    async def test_flush_writes_pending_change(self, client, monkeypatch, tmp_path):
+        import json
+
+        from gonzales.api.v1 import config as config_api
+        from gonzales.config import settings
+
+        config_file = tmp_path / "config.json"
+        monkeypatch.setattr(settings, "config_path", config_file)
+        monkeypatch.setattr(settings, "isp_name", settings.isp_name)
+        monkeypatch.setattr(config_api, "_config_cache", None)
+        monkeypatch.setattr(config_api, "_SAVE_DELAY_SECONDS", 60.0)
+
+        resp = await client.put("/api/v1/config", json={"isp_name": "Flushed ISP"})
+        assert resp.status_code == 200
+        assert not config_file.exists()
+
+        await config_api.flush_pending_save()
+        assert json.loads(config_file.read_text())["isp_name"] == "Flushed ISP"
 
 
 class TestAPIKeyProtection:
+    @pytest.fixture(autouse=True)
+    def enforce_api_key(self, app):
+        # require_api_key is bound at import time; force the real check so
+        # the tests can patch settings.api_key per test.
+        app.dependency_overrides[require_api_key] = verify_api_key
+
     async def test_delete_without_key_when_key_set(self, client):
         await _seed_measurements(1)
-        with patch("gonzales.api.dependencies.settings") as mock_settings:
-            mock_settings.api_key = "secret123"
+        with _api_key("secret123"):
             resp = await client.delete("/api/v1/measurements/1")
             assert resp.status_code == 403
 
     async def test_delete_with_correct_key(self, client):
         await _seed_measurements(1)
-        with patch("gonzales.api.dependencies.settings") as mock_settings:
-            mock_settings.api_key = "secret123"
+        with _api_key("secret123"):
             resp = await client.delete(
                 "/api/v1/measurements/1",
                 headers={"X-API-Key": "secret123"},
@@ -166,8 +519,7 @@ class TestAPIKeyProtection:
 
     async def test_delete_with_wrong_key(self, client):
         await _seed_measurements(1)
-        with patch("gonzales.api.dependencies.settings") as mock_settings:
-            mock_settings.api_key = "secret123"
+        with _api_key("secret123"):
             resp = await client.delete(
                 "/api/v1/measurements/1",
                 headers={"X-API-Key": "wrongkey"},
@@ -176,7 +528,65 @@ class TestAPIKeyProtection:
 
     async def test_no_key_required_when_not_configured(self, client):
         await _seed_measurements(1)
-        with patch("gonzales.api.dependencies.settings") as mock_settings:
-            mock_settings.api_key = ""
+        with _api_key(""):
             resp = await client.delete("/api/v1/measurements/1")
             assert resp.status_code == 200
+
+    async def test_repeat_key_digest_is_cached(self, client):
+        from gonzales.api import dependencies
+
+        await _seed_measurements(2)
+        with _api_key("secret123"):
+            for measurement_id in (1, 2):
+                resp = await client.delete(
+                    f"/api/v1/measurements/{measurement_id}",
+                    headers={"X-API-Key": "secret123"},
+                )
+                assert resp.status_code == 200
+        assert "secret123" in dependencies._digest_cache
+        assert len(dependencies._digest_cache) <= dependencies._MAX_CACHED_DIGESTS
+
+    async def test_bad_keys_do_not_evict_configured_digest(self, client):
+        from gonzales.api import dependencies
+
+        await _seed_measurements(1)
+        with _api_key("secret123"):
+            for i in range(dependencies._MAX_CACHED_DIGESTS + 1):
+                resp = await client.delete(
+                    "/api/v1/measurements/1", headers={"X-API-Key": f"bad{i}"}
+                )
+                assert resp.status_code == 403
+            # Only presented keys go through the memo
+            assert "secret123" not in dependencies._digest_cache
+            resp = await client.delete(
+                "/api/v1/measurements/1", headers={"X-API-Key": "secret123"}
+            )
+            assert resp.status_code == 200
+
+
+class TestAsyncDependencies:
+    """Dependencies and endpoints must resolve on the event loop, never in the threadpool."""
+
+    @pytest.fixture(autouse=True)
+    def forbid_threadpool(self, app, monkeypatch):
+        app.dependency_overrides[require_api_key] = verify_api_key
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("dependency resolved via threadpool")
+
+        monkeypatch.setattr("fastapi.dependencies.utils.run_in_threadpool", _fail)
+        monkeypatch.setattr("fastapi.dependencies.utils.contextmanager_in_threadpool", _fail)
+        monkeypatch.setattr("fastapi.routing.run_in_threadpool", _fail)
+
+    async def test_read_endpoints(self, client):
+        assert (await client.get("/api/v1/measurements")).status_code == 200
+        assert (await client.get("/api/v1/config")).status_code == 200
+
+    async def test_protected_endpoint(self, client):
+        await _seed_measurements(1)
+        with _api_key("secret123"):
+            resp = await client.delete(
+                "/api/v1/measurements/1",
+                headers={"X-API-Key": "secret123"},
+            )
+            assert resp.status_code == 200
@@ -2,7 +2,7 @@
 
 import asyncio
 
-from gonzales.services.event_bus import MAX_SUBSCRIBERS, EventBus
+from gonzales.services.event_bus import MAX_SUBSCRIBERS, EventBus, encode_frame, is_final_frame
 
 
 class TestEventBus:
@@ -142,3 +142,44 @@ class TestEventBus:
         await task
         await asyncio.sleep(0.01)
         assert bus.subscriber_count == 0
+
+    async def test_frame_subscribers_share_encoded_frame(self):
+        bus = EventBus()
+        q1 = bus.add_frame_subscriber()
+        q2 = bus.add_frame_subscriber()
+        assert bus.subscriber_count == 2
+
+        bus.publish({"event": "progress", "data": {"phase": "ping", "ping_ms": 12.5}})
+        frame = q1.get_nowait()
+        assert frame == b'event: progress\ndata: {"phase": "ping", "ping_ms": 12.5}\n\n'
+        assert q2.get_nowait() is frame
+        assert not is_final_frame(frame)
+
+        bus.publish({"event": "complete", "data": {}})
+        assert is_final_frame(q1.get_nowait())
+
+        bus.remove_frame_subscriber(q1)
+        bus.remove_frame_subscriber(q2)
+        assert bus.subscriber_count == 0
+
+    async def test_last_frame_encoded_once(self):
+        bus = EventBus()
+        assert bus.last_frame is None
+
+        event = {"event": "progress", "data": {"phase": "download"}}
+        bus.publish(event)
+        frame = bus.last_frame
+        assert frame == encode_frame(event)
+        assert bus.last_frame is frame
+
+        # The replay frame is not also queued for new stream subscribers
+        assert bus.add_frame_subscriber().empty()
+
+        bus.publish({"event": "complete", "data": {}})
+        assert bus.last_frame is None
+
+    async def test_frame_subscriber_limit(self):
+        bus = EventBus()
+        queues = [bus.add_frame_subscriber() for _ in range(MAX_SUBSCRIBERS)]
+        assert all(q is not None for q in queues)
+        assert bus.add_frame_subscriber() is None
@@ -0,0 +1,102 @@
+"""Tests for the export-data use case."""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+from gonzales.application.use_cases.export_data import ExportDataInput, ExportDataUseCase
+from gonzales.domain.entities import MeasurementEntity
+
+
+def _entity(i: int, **kwargs) -> MeasurementEntity:
+    values = dict(
+        id=i,
+        timestamp=datetime(2025, 6, 1, i),
+        download_mbps=100.125 + i,
+        upload_mbps=50.5,
+        ping_latency_ms=12.0,
+        ping_jitter_ms=2.0,
+        packet_loss_pct=0.0,
+        server_name="Test Server",
+        server_location="Berlin",
+        isp="Test ISP",
+        connection_type="ethernet",
+    )
+    values.update(kwargs)
+    return MeasurementEntity(**values)
+
+
+class ListRepository:
+    """Returns every measurement from get_by_time_range."""
+
+    def __init__(self, batches):
+        self.batches = batches
+
+    async def get_by_time_range(self, start, end, limit=None, **thresholds):
+        return [m for batch in self.batches for m in batch]
+
+
+class BatchRepository(ListRepository):
+    """Also supports batched iteration."""
+
+    def __init__(self, batches):
+        super().__init__(batches)
+        self.batch_sizes = []
+
+    async def iter_by_time_range(self, start, end, batch_size=1000, **thresholds):
+        self.batch_sizes.append(batch_size)
+        for batch in self.batches:
+            yield batch
+
+
+async def _stream(use_case, input_data) -> str:
+    return b"".join([chunk async for chunk in use_case.stream(input_data)]).decode()
+
+
+class TestExportDataUseCase:
+    async def test_csv_quotes_like_csv_writer(self):
+        m = _entity(1, server_name='Server, "North"', isp="Line\nBreak", packet_loss_pct=1.234)
+        output = await ExportDataUseCase(ListRepository([[m]])).execute(ExportDataInput())
+
+        header, row = list(csv.reader(io.StringIO(output.content)))
+        assert header[0] == "timestamp"
+        assert row[1] == "101.12"
+        assert row[5] == "1.23"
+        assert row[6] == 'Server, "North"'
+        assert row[8] == "Line\nBreak"
+        assert output.record_count == 1
+
+    async def test_json_round_trips(self):
+        batches = [[_entity(1), _entity(2)], [], [_entity(3)]]
+        for pretty in (False, True):
+            use_case = ExportDataUseCase(ListRepository(batches))
+            output = await use_case.execute(ExportDataInput(format="json", pretty=pretty))
+            data = json.loads(output.content)
+
+            assert data["record_count"] == output.record_count == 3
+            assert [r["id"] for r in data["measurements"]] == [1, 2, 3]
+            if pretty:
+                assert output.content == json.dumps(data, indent=2)
+
+    async def test_empty_json(self):
+        for pretty in (False, True):
+            use_case = ExportDataUseCase(ListRepository([]))
+            output = await use_case.execute(ExportDataInput(format="json", pretty=pretty))
+            data = json.loads(output.content)
+            assert data["measurements"] == []
+            assert data["record_count"] == 0
+
+    async def test_stream_uses_batches(self):
+        batches = [[_entity(1), _entity(2)], [_entity(3)]]
+        repo = BatchRepository(batches)
+        use_case = ExportDataUseCase(repo)
+
+        streamed = await _stream(use_case, ExportDataInput(format="json"))
+        assert repo.batch_sizes == [1000]
+        assert [r["id"] for r in json.loads(streamed)["measurements"]] == [1, 2, 3]
+
+        # Same CSV whether fetched in batches or as one list
+        batched = await _stream(use_case, ExportDataInput())
+        listed = await ExportDataUseCase(ListRepository(batches)).execute(ExportDataInput())
+        assert batched == listed.content
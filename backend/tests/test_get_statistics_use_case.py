@@ -0,0 +1,173 @@
+"""Tests for the get-statistics use case."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from gonzales.application.use_cases import get_statistics
+from gonzales.application.use_cases.get_statistics import (
+    GetStatisticsInput,
+    GetStatisticsUseCase,
+)
+
+START = datetime(2024, 1, 1)
+END = datetime(2024, 1, 8)
+ROW = (500.0, 250.0, 12.0, False, False)
+
+
+class FakeRepository:
+    """Serves fixed metric rows and counts how often they are fetched."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.fetches = 0
+
+    async def get_metric_rows(self, start, end, dl_threshold=None, ul_threshold=None):
+        self.fetches += 1
+        return self.rows
+
+    async def get_total_data_bytes(self):
+        return 0
+
+
+class FakeThresholdRepository(FakeRepository):
+    """Evaluates the flags against explicit thresholds, like the SQL adapter."""
+
+    def __init__(self, rows):
+        super().__init__(rows)
+        self.thresholds = []
+
+    async def get_metric_rows(self, start, end, dl_threshold=None, ul_threshold=None):
+        self.fetches += 1
+        self.thresholds.append((dl_threshold, ul_threshold))
+        return [
+            (
+                dl,
+                ul,
+                ping,
+                below_dl if dl_threshold is None else dl < dl_threshold,
+                below_ul if ul_threshold is None else ul < ul_threshold,
+            )
+            for dl, ul, ping, below_dl, below_ul in self.rows
+        ]
+
+
+class FakePortRepository:
+    """Implements only the domain port's get_by_time_range signature."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def get_by_time_range(self, start, end, limit=None):
+        return [
+            SimpleNamespace(
+                download_mbps=dl,
+                upload_mbps=ul,
+                ping_latency_ms=ping,
+                below_download_threshold=below_dl,
+                below_upload_threshold=below_ul,
+            )
+            for dl, ul, ping, below_dl, below_ul in self.rows
+        ]
+
+    async def get_total_data_bytes(self):
+        return 0
+
+
+class FakeConfig:
+    def __init__(self, **values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class TestGetStatisticsUseCase:
+    async def test_full_compliance_is_exactly_100(self):
+        for total in (11, 22, 39, 44, 78):
+            repo = FakeRepository([(500.0, 250.0, 12.0, False, False)] * total)
+            output = await GetStatisticsUseCase(repo).execute(GetStatisticsInput())
+            assert output.sla.download_compliance_pct == 100.0
+            assert output.sla.upload_compliance_pct == 100.0
+
+    async def test_violations_use_stored_flags_by_default(self):
+        # Stored flags say download is fine; current thresholds say it is not
+        repo = FakeThresholdRepository([(80.0, 250.0, 12.0, False, False)])
+        use_case = GetStatisticsUseCase(repo, FakeConfig(download_threshold_mbps=100.0))
+
+        output = await use_case.execute(GetStatisticsInput())
+        assert output.download_violations == 0
+        assert repo.thresholds == [(None, None)]
+
+        output = await use_case.execute(GetStatisticsInput(use_current_thresholds=True))
+        assert output.download_violations == 1
+        assert repo.thresholds[-1] == (85.0, 42.5)
+
+    async def test_repository_with_port_signature(self):
+        repo = FakePortRepository([ROW, (80.0, 250.0, 12.0, True, False)])
+        output = await GetStatisticsUseCase(repo).execute(GetStatisticsInput())
+        assert output.total_tests == 2
+        assert output.download_violations == 1
+
+
+class TestStatisticsCache:
+    def window(self, hour=0):
+        return GetStatisticsInput(start_date=START.replace(hour=hour), end_date=END)
+
+    async def test_hit_reuses_result(self):
+        repo = FakeRepository([ROW])
+        use_case = GetStatisticsUseCase(repo)
+
+        first = await use_case.execute(self.window())
+        second = await use_case.execute(self.window())
+        assert second is first
+        assert repo.fetches == 1
+
+    async def test_expired_entry_is_recomputed(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(get_statistics.time, "monotonic", lambda: clock[0])
+        repo = FakeRepository([ROW])
+        use_case = GetStatisticsUseCase(repo)
+
+        await use_case.execute(self.window())
+        clock[0] += get_statistics.STATISTICS_CACHE_TTL_SECONDS - 1
+        await use_case.execute(self.window())
+        assert repo.fetches == 1
+
+        clock[0] += 1
+        await use_case.execute(self.window())
+        assert repo.fetches == 2
+
+    async def test_oldest_entry_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(get_statistics, "STATISTICS_CACHE_MAX_ENTRIES", 2)
+        repo = FakeRepository([ROW])
+        use_case = GetStatisticsUseCase(repo)
+
+        for hour in (0, 1, 2):
+            await use_case.execute(self.window(hour))
+        assert repo.fetches == 3
+
+        await use_case.execute(self.window(2))
+        assert repo.fetches == 3
+        await use_case.execute(self.window(0))
+        assert repo.fetches == 4
+
+    async def test_data_version_change_invalidates(self):
+        repo = FakeRepository([ROW])
+        repo.data_version = 0
+        use_case = GetStatisticsUseCase(repo)
+
+        await use_case.execute(self.window())
+        repo.rows = [ROW, (50.0, 10.0, 30.0, True, True)]
+        repo.data_version = 1
+        output = await use_case.execute(self.window())
+        assert repo.fetches == 2
+        assert output.total_tests == 2
+
+    async def test_invalidate_cache(self):
+        repo = FakeRepository([ROW])
+        use_case = GetStatisticsUseCase(repo)
+
+        await use_case.execute(self.window())
+        use_case.invalidate_cache()
+        await use_case.execute(self.window())
+        assert repo.fetches == 2
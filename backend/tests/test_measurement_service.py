@@ -67,6 +67,30 @@ class TestMeasurementServiceDatabase:
         assert latest is not None
         # Latest should be the most recently added (by timestamp)
 
+    @pytest.mark.asyncio
+    async def test_get_latest_out_cached_until_delete(
+        self, session: AsyncSession, make_measurement
+    ):
+        """Test the latest measurement is reused until the service deletes it."""
+        service = MeasurementService()
+
+        m = make_measurement(download_mbps=100.0)
+        session.add(m)
+        await session.commit()
+        await session.refresh(m)
+
+        first = await service.get_latest_out(session)
+        assert first is not None
+        assert first.download_mbps == 100.0
+
+        # A row written behind the service's back is not seen within the TTL
+        session.add(make_measurement(download_mbps=200.0))
+        await session.commit()
+        assert await service.get_latest_out(session) is first
+
+        await service.delete_all(session)
+        assert await service.get_latest_out(session) is None
+
     @pytest.mark.asyncio
     async def test_get_paginated(self, session: AsyncSession, make_measurement):
         """Test paginated measurement retrieval."""
@@ -0,0 +1,88 @@
+"""Tests for the queued event bus adapter."""
+
+import asyncio
+
+from gonzales.infrastructure.adapters.queued_event_bus import QueuedEventBus
+
+
+class TestQueuedEventBus:
+    async def test_post_returns_before_handlers_run(self):
+        bus = QueuedEventBus()
+        received = []
+        bus.subscribe("measurement_completed", received.append)
+
+        bus.post("measurement_completed", {"measurement_id": 1})
+        assert received == []
+
+        await bus.drain()
+        assert received == [{"measurement_id": 1}]
+        await bus.close()
+
+    async def test_async_handlers_and_failures(self):
+        bus = QueuedEventBus()
+        received = []
+
+        async def handler(data):
+            await asyncio.sleep(0)
+            received.append(data)
+
+        def failing(data):
+            raise RuntimeError("boom")
+
+        bus.subscribe("threshold_violation", failing)
+        bus.subscribe("threshold_violation", handler)
+        bus.publish("threshold_violation", {"measurement_id": 2})
+        bus.post("threshold_violation", {"measurement_id": 3})
+        await bus.drain()
+
+        # A failing handler neither stops the others nor the dispatcher
+        assert received == [{"measurement_id": 2}, {"measurement_id": 3}]
+        await bus.close()
+
+    async def test_full_queue_drops_oldest(self):
+        bus = QueuedEventBus(maxsize=2)
+        received = []
+        bus.subscribe("e", received.append)
+
+        for i in range(4):
+            bus.post("e", {"n": i})
+        await bus.drain()
+
+        assert received == [{"n": 2}, {"n": 3}]
+        await bus.close()
+
+    async def test_unsubscribe(self):
+        bus = QueuedEventBus()
+        received = []
+        bus.subscribe("e", received.append)
+        bus.unsubscribe("e", received.append)
+
+        bus.post("e", {})
+        await bus.drain()
+        assert received == []
+        await bus.close()
+
+    async def test_close_delivers_queued_events(self):
+        bus = QueuedEventBus()
+        received = []
+        bus.subscribe("e", received.append)
+
+        bus.post("e", {"n": 1})
+        await bus.close()
+        assert received == [{"n": 1}]
+
+    def test_survives_event_loop_change(self):
+        bus = QueuedEventBus()
+        received = []
+        bus.subscribe("e", received.append)
+
+        async def post_and_drain(n):
+            bus.post("e", {"n": n})
+            await bus.drain()
+
+        # The CLI and tests run each command in a fresh asyncio.run loop
+        asyncio.run(post_and_drain(1))
+        asyncio.run(post_and_drain(2))
+        assert received == [{"n": 1}, {"n": 2}]
+
+        asyncio.run(bus.close())
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta, timezone
 
-from gonzales.db.models import TestFailure
+from gonzales.db.models import Measurement, Outage, TestFailure
 from gonzales.db.repository import MeasurementRepository, TestFailureRepository
 
 
@@ -54,6 +54,16 @@ class TestMeasurementRepository:
         assert deleted is True
         assert await repo.count() == 0
 
+    async def test_data_version_changes_on_write(self, session, make_measurement):
+        repo = MeasurementRepository(session)
+        version = repo.data_version
+        saved = await repo.create(make_measurement())
+        assert repo.data_version != version
+
+        version = repo.data_version
+        await repo.delete_by_id(saved.id)
+        assert repo.data_version != version
+
     async def test_delete_by_id_not_found(self, session):
         repo = MeasurementRepository(session)
         deleted = await repo.delete_by_id(999)
@@ -127,6 +137,57 @@ class TestMeasurementRepository:
         )
         assert len(filtered) == 3
 
+    async def test_iter_in_range_batches(self, session, make_measurement):
+        repo = MeasurementRepository(session)
+        base = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        for i in range(5):
+            await repo.create(
+                make_measurement(download_mbps=100 + i, timestamp=base + timedelta(days=i))
+            )
+
+        batches = [
+            batch
+            async for batch in repo.iter_in_range(base + timedelta(days=1), None, batch_size=2)
+        ]
+        assert [len(b) for b in batches] == [2, 2]
+        assert [m.download_mbps for b in batches for m in b] == [101, 102, 103, 104]
+
+    async def test_iter_columns_in_range(self, session, make_measurement):
+        repo = MeasurementRepository(session)
+        base = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        for i in range(3):
+            await repo.create(
+                make_measurement(download_mbps=100 + i, timestamp=base + timedelta(days=i))
+            )
+
+        batches = [
+            batch
+            async for batch in repo.iter_columns_in_range(
+                (Measurement.id, Measurement.download_mbps), base, None, batch_size=2
+            )
+        ]
+        assert [len(b) for b in batches] == [2, 1]
+        assert [row.download_mbps for b in batches for row in b] == [100, 101, 102]
+
+    async def test_get_metric_rows(self, session, make_measurement):
+        repo = MeasurementRepository(session)
+        base = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        await repo.create(make_measurement(
+            timestamp=base, download_mbps=90.0, upload_mbps=40.0,
+            ping_latency_ms=12.0, below_download_threshold=True,
+        ))
+        await repo.create(make_measurement(timestamp=base - timedelta(days=2)))
+
+        rows = await repo.get_metric_rows(base - timedelta(hours=1), base + timedelta(hours=1))
+        assert [tuple(r) for r in rows] == [(90.0, 40.0, 12.0, True, False)]
+
+        # Explicit thresholds override the flags stored at insert time
+        rows = await repo.get_metric_rows(
+            base - timedelta(hours=1), base + timedelta(hours=1),
+            dl_threshold=80.0, ul_threshold=50.0,
+        )
+        assert [tuple(r) for r in rows] == [(90.0, 40.0, 12.0, False, True)]
+
     async def test_get_statistics(self, session, make_measurement):
         repo = MeasurementRepository(session)
         await repo.create(make_measurement(download_mbps=100, upload_mbps=50,
@@ -140,6 +201,41 @@ class TestMeasurementRepository:
         assert stats["max_download"] == 300
         assert stats["download_violations"] == 1
 
+    async def test_get_summary_snapshot(self, session, make_measurement):
+        repo = MeasurementRepository(session)
+        base = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        for day, download in enumerate([100, 200, 300]):
+            await repo.create(make_measurement(
+                timestamp=base + timedelta(days=day),
+                download_mbps=download,
+                ping_latency_ms=10.0 + day,
+                below_download_threshold=download < 150,
+            ))
+        # Outside the window
+        await repo.create(make_measurement(timestamp=base - timedelta(days=1), download_mbps=999))
+        session.add_all([
+            Outage(started_at=base + timedelta(hours=1), failure_count=3),
+            Outage(started_at=base - timedelta(days=2), failure_count=3),
+        ])
+        await session.commit()
+
+        summary = await repo.get_summary_snapshot(base, base + timedelta(days=7))
+        assert summary["total_tests"] == 3
+        assert summary["avg_download"] == 200
+        assert summary["avg_ping"] == 11.0
+        assert summary["download_violations"] == 1
+        assert summary["outage_count"] == 1
+        assert summary["latest_download"] == 300
+        assert summary["latest_ping"] == 12.0
+
+    async def test_get_summary_snapshot_empty(self, session):
+        base = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        summary = await MeasurementRepository(session).get_summary_snapshot(
+            base, base + timedelta(days=7)
+        )
+        assert summary["total_tests"] == 0
+        assert summary["latest_timestamp"] is None
+
 
 class TestTestFailureRepository:
     async def test_create_failure(self, session):
@@ -0,0 +1,122 @@
+"""Tests for the run-speedtest use case."""
+
+import asyncio
+from datetime import datetime
+
+from gonzales.application.use_cases.run_speedtest import (
+    RunSpeedtestInput,
+    RunSpeedtestUseCase,
+    SpeedtestResult,
+)
+
+
+def _result(download_mbps: float = 500.0, upload_mbps: float = 250.0) -> SpeedtestResult:
+    return SpeedtestResult(
+        download_bps=download_mbps * 1_000_000,
+        upload_bps=upload_mbps * 1_000_000,
+        download_bytes=0,
+        upload_bytes=0,
+        ping_latency_ms=12.0,
+        ping_jitter_ms=2.0,
+        packet_loss_pct=0.0,
+        server_id=1,
+        server_name="Test Server",
+        server_location="Berlin",
+        server_country="DE",
+        isp="Test ISP",
+        internal_ip="192.168.1.1",
+        external_ip="1.2.3.4",
+        interface_name="eth0",
+        is_vpn=False,
+        result_id="r1",
+        result_url="https://speedtest.net/result/1",
+        raw_json={},
+        timestamp=datetime.utcnow(),
+    )
+
+
+class FakeSpeedtest:
+    def __init__(self, result: SpeedtestResult):
+        self.result = result
+
+    async def run_test(self, server_id=None):
+        return self.result
+
+
+class FakeRepository:
+    def __init__(self):
+        self.saved = []
+
+    async def save(self, entity):
+        entity.id = len(self.saved) + 1
+        self.saved.append(entity)
+        return entity
+
+    async def get_latest(self):
+        return self.saved[-1] if self.saved else None
+
+
+class FakeEventBus:
+    def __init__(self):
+        self.posted = []
+
+    def publish(self, event_type, data):
+        self.posted.append((event_type, data))
+
+    def post(self, event_type, data):
+        self.posted.append((event_type, data))
+
+
+class SlowWebhook:
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.sent = []
+
+    async def send(self, url, event_type, payload):
+        await self.release.wait()
+        self.sent.append((url, event_type, payload))
+        return True
+
+
+class FakeConfig:
+    def __init__(self, **values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def _use_case(result=None, webhook=None, **config):
+    bus = FakeEventBus()
+    use_case = RunSpeedtestUseCase(
+        speedtest=FakeSpeedtest(result or _result()),
+        measurements=FakeRepository(),
+        event_bus=bus,
+        webhook=webhook,
+        config=FakeConfig(**config),
+    )
+    return use_case, bus
+
+
+class TestRunSpeedtestUseCase:
+    async def test_posts_events(self):
+        use_case, bus = _use_case(_result(download_mbps=10.0))
+        output = await use_case.execute(RunSpeedtestInput(triggered_by="scheduled"))
+
+        assert not output.is_compliant
+        assert [event for event, _ in bus.posted] == [
+            "measurement_completed",
+            "threshold_violation",
+        ]
+
+    async def test_webhook_does_not_block_execute(self):
+        webhook = SlowWebhook()
+        use_case, _ = _use_case(webhook=webhook, webhook_url="https://example.com/hook")
+
+        await use_case.execute(RunSpeedtestInput(triggered_by="scheduled"))
+        assert webhook.sent == []
+
+        webhook.release.set()
+        await asyncio.sleep(0)
+        assert len(webhook.sent) == 1
+        assert webhook.sent[0][1] == "speedtest_complete"
@@ -68,3 +68,47 @@ class TestTopologyTargetValidation:
         response = await client.post("/api/v1/topology/analyze?target=93.184.216.34")
         # Should pass validation (500 if traceroute fails, 200 if succeeds)
         assert response.status_code in (200, 500, 429)
+
+
+class TestValidateTarget:
+    """Direct checks of _validate_target, independent of rate limiting."""
+
+    @pytest.mark.parametrize(
+        ("target", "detail"),
+        [
+            ("127.0.0.1", "Loopback"),
+            ("::1", "Loopback"),
+            ("10.0.0.1", "Private IP"),
+            ("172.31.255.255", "Private IP"),
+            ("169.254.1.1", "Private IP"),
+            ("fe80::1", "Private IP"),
+            ("224.0.0.1", "Multicast"),
+            ("ff02::1", "Multicast"),
+            ("255.255.255.255", "Reserved"),
+            ("01.1.1.1", "Invalid IP"),
+            ("not-an-ip", "Invalid IP"),
+        ],
+    )
+    def test_rejected(self, target, detail):
+        from fastapi import HTTPException
+
+        from gonzales.api.v1.topology import _validate_target
+
+        with pytest.raises(HTTPException) as exc_info:
+            _validate_target(target)
+        assert exc_info.value.status_code == 400
+        assert detail in exc_info.value.detail
+
+    @pytest.mark.parametrize(
+        ("target", "expected"),
+        [
+            (None, "1.1.1.1"),
+            ("93.184.216.34", "93.184.216.34"),
+            ("172.32.0.1", "172.32.0.1"),
+            ("2606:4700:0::1111", "2606:4700::1111"),
+        ],
+    )
+    def test_accepted(self, target, expected):
+        from gonzales.api.v1.topology import _validate_target
+
+        assert _validate_target(target) == expected